@@ -8,6 +8,7 @@ with enhanced formatting (definition, plain_english, case_study, key_benefit).
 
 import asyncio
 import os
+import sys
 import uuid
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -17,6 +18,9 @@ from pathlib import Path
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
+from glossary_mentions import rebuild_mentions  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
@@ -238,6 +242,8 @@ async def main():
         import traceback
         traceback.print_exc()
     finally:
+        await bump_catalog_version(db, "glossary")
+        await rebuild_mentions(db)
         client.close()
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Catalog Cache
+Process-local read-through cache for the static catalog collections
+(courses, glossary, tools, marketplace, quiz questions). Payloads are stored as
+pre-serialized JSON bytes keyed by a per-collection version stamp kept in
+the `catalog_versions` collection, which /initialize-data and the
+maintenance scripts bump whenever they change catalog data.
+"""
+
+import gzip
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+CATALOG_COLLECTIONS = ("courses", "glossary", "tools", "marketplace", "quiz_questions")
+VERSIONS_COLLECTION = "catalog_versions"
+
+
+async def bump_catalog_version(db, *collections: str):
+    """Mark catalog collections as changed so every server process drops its cached copy."""
+    for name in collections or CATALOG_COLLECTIONS:
+        await db[VERSIONS_COLLECTION].update_one(
+            {"_id": name},
+            {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+
+def serialize_json(content: Any) -> bytes:
+    """Encode content exactly the way FastAPI's default JSONResponse would."""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q}, keeping q=0 entries that refuse a coding."""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def accepts_encoding(accepted: Dict[str, float], coding: str) -> bool:
+    """Whether the client allows coding; an explicit entry wins over the "*" wildcard."""
+    return accepted.get(coding, accepted.get("*", 0.0)) > 0
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    version: int
+    body: bytes
+    etag: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def to_response(self, if_none_match: Optional[str] = None, accept_encoding: Optional[str] = None) -> Response:
+        body, etag, headers = self.body, self.etag, {"Cache-Control": "no-cache"}
+        if self.encoded:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(accept_encoding)
+            for coding in ("br", "gzip"):
+                if coding in self.encoded and accepts_encoding(accepted, coding):
+                    body, etag = self.encoded[coding], '%s-%s"' % (self.etag[:-1], coding)
+                    headers["Content-Encoding"] = coding
+                    break
+        headers["ETag"] = etag
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def compress_body(body: bytes) -> Dict[str, bytes]:
+    """Pre-compress a payload once so it can be served to any client without per-request work."""
+    encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=11)
+    return encoded
+
+
+def build_payload(version: int, content: Any, compress: bool = False) -> CachedPayload:
+    """Serialize content once, with an ETag derived from version and body, ready to serve."""
+    body = serialize_json(content)
+    return CachedPayload(
+        version=version,
+        body=body,
+        etag='"%s-%s"' % (version, hashlib.blake2b(body, digest_size=12).hexdigest()),
+        encoded=compress_body(body) if compress else {},
+    )
+
+
+class CatalogCache:
+    """Serves catalog payloads from memory until the collection's version stamp changes"""
+
+    def __init__(self, db, check_interval: float = 5.0):
+        self.db = db
+        self.check_interval = check_interval
+        self._versions: Dict[str, int] = {}
+        self._checked_at = 0.0
+        self._entries: Dict[str, CachedPayload] = {}
+
+    async def versions(self) -> Dict[str, int]:
+        """Current version stamps, re-read from MongoDB at most once per check_interval."""
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            stamps = await self.db[VERSIONS_COLLECTION].find().to_list(None)
+            self._versions = {stamp["_id"]: stamp.get("version", 0) for stamp in stamps}
+            self._checked_at = now
+        return self._versions
+
+    async def get(self, key: str, collection: str, loader: Callable[[], Awaitable[Any]], compress: bool = False) -> CachedPayload:
+        """Return the cached payload for key, calling loader only when the collection has changed.
+
+        With compress=True the payload also carries gzip (and brotli, when installed) bodies.
+        """
+        version = (await self.versions()).get(collection, 0)
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+
+        entry = build_payload(version, await loader(), compress)
+        self._entries[key] = entry
+        return entry
+
+    def invalidate(self):
+        """Drop every cached payload and force a version re-check on the next request."""
+        self._entries.clear()
+        self._checked_at = 0.0
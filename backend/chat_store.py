@@ -0,0 +1,164 @@
+"""
+Chat Message Store
+Chat messages live in their own chat_messages collection keyed by
+(thread_id, timestamp) instead of being $pushed into the thread document,
+so threads stay far below the 16 MB document limit and history is read a
+page at a time. Thread documents keep only metadata, a message count and a
+preview of the last message.
+
+Search runs against a {user_id, message: text, response: text} index, so
+hits are ranked per message by textScore and only one user's history is
+ever scanned.
+"""
+
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from glossary_search import tokenize
+
+MESSAGES_COLLECTION = "chat_messages"
+PREVIEW_CHARS = 160
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+SNIPPET_CHARS = 160
+
+
+class ChatCursorError(ValueError):
+    pass
+
+
+def message_preview(message: dict) -> dict:
+    """The slice of a message stored on its thread for thread listings."""
+    return {
+        "id": message["id"],
+        "message": message["message"][:PREVIEW_CHARS],
+        "timestamp": message["timestamp"],
+    }
+
+
+def encode_cursor(message: dict) -> str:
+    raw = f"{message['timestamp'].isoformat()}|{message['id']}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        timestamp, message_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), message_id
+    except ValueError:
+        raise ChatCursorError("Invalid message cursor")
+
+
+async def insert_messages(db, thread_id: str, messages: List[dict]):
+    """Store messages for a thread; ids that are already stored are skipped."""
+    if not messages:
+        return
+    try:
+        await db[MESSAGES_COLLECTION].insert_many(
+            [{**message, "thread_id": thread_id} for message in messages], ordered=False
+        )
+    except BulkWriteError as e:
+        # Only duplicate ids are expected here, e.g. when a migration is re-run
+        if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+            raise
+
+
+async def append_message(db, user_id: str, thread_id: str, message: dict) -> bool:
+    """Add a message and refresh the thread's summary fields; False if the thread does not exist."""
+    result = await db.chat_threads.update_one(
+        {"id": thread_id, "user_id": user_id},
+        {
+            "$set": {"last_updated": datetime.utcnow(), "last_message": message_preview(message)},
+            "$inc": {"message_count": 1}
+        }
+    )
+    if not result.matched_count:
+        return False
+    await insert_messages(db, thread_id, [message])
+    return True
+
+
+async def fetch_messages(db, thread_id: str, before: Optional[str] = None,
+                         limit: int = DEFAULT_PAGE_SIZE) -> Tuple[List[dict], Optional[str]]:
+    """Return one page of messages older than `before` in chronological order, plus the next cursor."""
+    query = {"thread_id": thread_id}
+    if before:
+        timestamp, message_id = decode_cursor(before)
+        query["$or"] = [
+            {"timestamp": {"$lt": timestamp}},
+            {"timestamp": timestamp, "id": {"$lt": message_id}},
+        ]
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    page = await db[MESSAGES_COLLECTION].find(query, {"_id": 0}).sort(
+        [("timestamp", -1), ("id", -1)]
+    ).limit(limit + 1).to_list(limit + 1)
+
+    next_cursor = encode_cursor(page[limit - 1]) if len(page) > limit else None
+    page = page[:limit]
+    page.reverse()
+    return page, next_cursor
+
+
+async def migrate_embedded_messages(db) -> int:
+    """Move messages still embedded in chat_threads documents into chat_messages; returns threads migrated."""
+    migrated = 0
+    async for thread in db.chat_threads.find({"messages": {"$exists": True}}, {"id": 1, "messages": 1}):
+        messages = thread.get("messages") or []
+        await insert_messages(db, thread["id"], messages)
+        update = {"$unset": {"messages": ""}, "$set": {"message_count": len(messages)}}
+        if messages:
+            latest = max(messages, key=lambda m: m["timestamp"])
+            update["$set"]["last_message"] = message_preview(latest)
+        await db.chat_threads.update_one({"_id": thread["_id"]}, update)
+        migrated += 1
+    return migrated
+
+
+def make_snippet(text: str, terms: List[str], width: int = SNIPPET_CHARS) -> str:
+    """A window of text around the earliest occurrence of any search term."""
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(term) for term in terms) if p >= 0]
+    start = max(0, min(positions) - width // 3) if positions else 0
+    end = min(len(text), start + width)
+    return ("..." if start else "") + text[start:end] + ("..." if end < len(text) else "")
+
+
+async def search_messages(db, user_id: str, query: str, limit: int = DEFAULT_PAGE_SIZE) -> List[dict]:
+    """Rank a user's messages against a text query; each hit carries a snippet and its thread."""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    score = {"$meta": "textScore"}
+    hits = await db[MESSAGES_COLLECTION].find(
+        {"user_id": user_id, "$text": {"$search": query}},
+        {"_id": 0, "id": 1, "thread_id": 1, "message": 1, "response": 1, "timestamp": 1, "score": score}
+    ).sort([("score", score)]).limit(limit).to_list(limit)
+    if not hits:
+        return []
+
+    thread_ids = list({hit["thread_id"] for hit in hits})
+    titles = {
+        thread["id"]: thread["title"]
+        for thread in await db.chat_threads.find(
+            {"id": {"$in": thread_ids}, "user_id": user_id}, {"_id": 0, "id": 1, "title": 1}
+        ).to_list(len(thread_ids))
+    }
+
+    terms = tokenize(query)
+    results = []
+    for hit in hits:
+        # Prefer the user's own words unless only the response contains a term
+        in_message = any(t in hit["message"].lower() for t in terms)
+        field = "response" if not in_message and any(t in hit["response"].lower() for t in terms) else "message"
+        results.append({
+            "thread_id": hit["thread_id"],
+            "thread_title": titles.get(hit["thread_id"], ""),
+            "message_id": hit["id"],
+            "timestamp": hit["timestamp"],
+            "score": hit["score"],
+            "matched_field": field,
+            "snippet": make_snippet(hit[field], terms),
+        })
+    return results
@@ -0,0 +1,50 @@
+"""
+Content Pack Loader
+Seed content (courses with lesson bodies, quiz questions, glossary terms,
+tools and marketplace items) lives in versioned JSON files under
+content_pack/ rather than in server.py, and is only read when seeding runs.
+Collection files may be plain JSON or gzip-compressed (.json.gz).
+"""
+
+import gzip
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+CONTENT_PACK_DIR = Path(__file__).parent / 'content_pack'
+SUPPORTED_FORMAT = 1
+
+
+class ContentPackError(Exception):
+    pass
+
+
+@dataclass
+class ContentPack:
+    version: str
+    collections: Dict[str, List[dict]]
+
+    def __getitem__(self, collection: str) -> List[dict]:
+        return self.collections.get(collection, [])
+
+
+def _read_json(path: Path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_content_pack(pack_dir: Path = CONTENT_PACK_DIR) -> ContentPack:
+    """Read the manifest and every collection file it lists."""
+    manifest = _read_json(pack_dir / "manifest.json")
+    if manifest.get("format") != SUPPORTED_FORMAT:
+        raise ContentPackError(f"Unsupported content pack format {manifest.get('format')} in {pack_dir}")
+
+    collections = {}
+    for name, entry in manifest["collections"].items():
+        documents = _read_json(pack_dir / entry["file"])
+        if len(documents) != entry["count"]:
+            raise ContentPackError(f"{entry['file']} has {len(documents)} documents, manifest expects {entry['count']}")
+        collections[name] = documents
+    return ContentPack(version=manifest["version"], collections=collections)
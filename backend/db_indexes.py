@@ -0,0 +1,188 @@
+"""
+Index Manager
+Declares the MongoDB indexes every query in server.py depends on, creates
+any that are missing on startup, reports drift between the declared and
+live index sets, and warns when a hot query shape still plans a COLLSCAN.
+Startup fails if a unique index cannot be built, since code relies on
+those to reject duplicates.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    keys: Tuple[Tuple[str, Any], ...]
+    unique: bool = False
+    expire_after_seconds: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return "_".join(f"{k}_{d}" for k, d in self.keys)
+
+    @property
+    def live_keys(self) -> Tuple[Tuple[str, Any], ...]:
+        """The key pattern as index_information() reports it; text fields collapse into _fts/_ftsx."""
+        keys = []
+        for k, d in self.keys:
+            if d != TEXT:
+                keys.append((k, d))
+            elif ("_fts", TEXT) not in keys:
+                keys.extend([("_fts", TEXT), ("_ftsx", 1)])
+        return tuple(keys)
+
+    def model(self) -> IndexModel:
+        options = {} if self.expire_after_seconds is None else {"expireAfterSeconds": self.expire_after_seconds}
+        return IndexModel(list(self.keys), name=self.name, unique=self.unique, **options)
+
+
+def _index(*keys: Tuple[str, Any], unique: bool = False, expire_after_seconds: Optional[int] = None) -> IndexSpec:
+    return IndexSpec(tuple(keys), unique=unique, expire_after_seconds=expire_after_seconds)
+
+
+# Indexes each collection needs; unique wherever the code treats the key as an identity
+REQUIRED_INDEXES: Dict[str, List[IndexSpec]] = {
+    "courses": [_index(("id", ASCENDING), unique=True)],
+    "glossary": [_index(("id", ASCENDING), unique=True)],
+    "tools": [_index(("id", ASCENDING), unique=True)],
+    "marketplace": [_index(("id", ASCENDING), unique=True)],
+    "quiz_questions": [
+        _index(("id", ASCENDING), unique=True),
+        _index(("course_id", ASCENDING), ("module_id", ASCENDING)),
+    ],
+    "user_xp": [_index(("user_id", ASCENDING), unique=True)],
+    "user_progress": [
+        _index(("user_id", ASCENDING), ("course_id", ASCENDING), ("lesson_id", ASCENDING), unique=True),
+    ],
+    "chat_threads": [
+        _index(("id", ASCENDING), unique=True),
+        _index(("user_id", ASCENDING), ("last_updated", DESCENDING)),
+    ],
+    "chat_messages": [
+        _index(("id", ASCENDING), unique=True),
+        _index(("thread_id", ASCENDING), ("timestamp", ASCENDING), ("id", ASCENDING)),
+        # Equality prefix on user_id keeps search cost proportional to one user's history
+        _index(("user_id", ASCENDING), ("message", TEXT), ("response", TEXT)),
+    ],
+    "user_subscriptions": [_index(("user_id", ASCENDING), unique=True)],
+    # Records expire with the quiz session tokens they describe
+    "quiz_session_uses": [_index(("expires_at", ASCENDING), expire_after_seconds=0)],
+    "glossary_mentions": [
+        _index(("term_key", ASCENDING), ("count", DESCENDING), ("course_id", ASCENDING)),
+        _index(("course_id", ASCENDING)),
+    ],
+}
+
+# Representative query shapes from the request path, checked with explain() after provisioning
+HOT_QUERIES: List[Tuple[str, Dict[str, Any], Optional[List[Tuple[str, int]]]]] = [
+    ("courses", {"id": ""}, None),
+    ("glossary", {"id": ""}, None),
+    ("quiz_questions", {"course_id": "", "module_id": 0}, None),
+    ("quiz_questions", {"id": ""}, None),
+    ("user_xp", {"user_id": ""}, None),
+    ("user_progress", {"user_id": "", "course_id": "", "lesson_id": ""}, None),
+    ("chat_threads", {"user_id": ""}, [("last_updated", DESCENDING)]),
+    ("chat_messages", {"thread_id": ""}, [("timestamp", DESCENDING), ("id", DESCENDING)]),
+    ("chat_messages", {"user_id": "", "$text": {"$search": "refund"}}, None),
+    ("user_subscriptions", {"user_id": ""}, None),
+    ("glossary_mentions", {"term_key": ""}, [("count", DESCENDING), ("course_id", ASCENDING)]),
+]
+
+
+class IndexProvisioningError(RuntimeError):
+    """A required unique index could not be built"""
+
+
+@dataclass
+class IndexReport:
+    created: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    failed_unique: List[str] = field(default_factory=list)
+    mismatched: List[str] = field(default_factory=list)
+    undeclared: List[str] = field(default_factory=list)
+    collection_scans: List[str] = field(default_factory=list)
+
+
+def _plan_stages(plan: Any) -> List[str]:
+    """Collect every stage name in an explain() plan tree."""
+    if isinstance(plan, dict):
+        stages = [plan["stage"]] if isinstance(plan.get("stage"), str) else []
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+        return stages
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _plan_stages(item)]
+    return []
+
+
+async def ensure_indexes(db, required: Dict[str, List[IndexSpec]] = REQUIRED_INDEXES) -> IndexReport:
+    """Create missing indexes and report any that differ from the declarations."""
+    report = IndexReport()
+    for collection, specs in required.items():
+        live = await db[collection].index_information()
+        live_by_keys = {tuple(tuple(k) for k in info["key"]): (name, info) for name, info in live.items()}
+
+        for spec in specs:
+            existing = live_by_keys.pop(spec.live_keys, None)
+            if existing is None:
+                try:
+                    await db[collection].create_indexes([spec.model()])
+                    report.created.append(f"{collection}.{spec.name}")
+                except OperationFailure as e:
+                    # Typically duplicate data blocking a unique index
+                    report.failed.append(f"{collection}.{spec.name}: {e}")
+                    if spec.unique:
+                        report.failed_unique.append(f"{collection}.{spec.name}")
+            elif bool(existing[1].get("unique")) != spec.unique:
+                report.mismatched.append(f"{collection}.{existing[0]} (unique={bool(existing[1].get('unique'))}, expected {spec.unique})")
+
+        report.undeclared.extend(f"{collection}.{name}" for name, _ in live_by_keys.values() if name != "_id_")
+    return report
+
+
+async def find_collection_scans(db, queries=HOT_QUERIES) -> List[str]:
+    """Explain each hot query shape and return those whose winning plan is a COLLSCAN."""
+    scans = []
+    for collection, query, sort in queries:
+        cursor = db[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            explained = await cursor.explain()
+        except OperationFailure as e:
+            # e.g. a $text query whose text index is missing; the audit must not take startup down
+            logger.warning(f"Could not explain {collection} {query}: {e}")
+            continue
+        if "COLLSCAN" in _plan_stages(explained.get("queryPlanner", {}).get("winningPlan", {})):
+            scans.append(f"{collection} {query}")
+    return scans
+
+
+async def provision_indexes(db) -> IndexReport:
+    """Startup entry point: ensure indexes, audit query plans and log the outcome.
+
+    Raises IndexProvisioningError if any unique index could not be built.
+    """
+    report = await ensure_indexes(db)
+    report.collection_scans = await find_collection_scans(db)
+
+    for name in report.created:
+        logger.info(f"Created index {name}")
+    for failure in report.failed:
+        logger.error(f"Could not create index {failure}")
+    for drift in report.mismatched:
+        logger.warning(f"Index drift: {drift}")
+    for name in report.undeclared:
+        logger.info(f"Undeclared index {name}")
+    for query in report.collection_scans:
+        logger.warning(f"Slow query: {query} plans a COLLSCAN")
+    if report.failed_unique:
+        raise IndexProvisioningError(f"Required unique indexes missing: {', '.join(report.failed_unique)}")
+    return report
@@ -0,0 +1,79 @@
+"""
+Entitlements
+Resolves a user's subscription into a small immutable Entitlement (plan,
+course access, active flag) that access checks read instead of the raw
+subscription document. Entitlements are cached per user with a TTL and
+invalidated when the subscription is updated. Reads never write: a user
+with no stored subscription resolves to DEFAULT_ENTITLEMENT.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+SUBSCRIPTION_FIELDS = {"_id": 0, "plan_type": 1, "course_access": 1, "has_active_subscription": 1, "subscription_tier": 1}
+
+
+@dataclass(frozen=True)
+class Entitlement:
+    plan_type: str = "none"
+    course_access: FrozenSet[str] = frozenset()
+    has_active_subscription: bool = False
+    subscription_tier: str = "standard"
+
+    @property
+    def has_full_access(self) -> bool:
+        return self.plan_type == "all_access" and self.has_active_subscription
+
+    def can_access_course(self, course_id: str) -> bool:
+        return self.has_full_access or (self.has_active_subscription and course_id in self.course_access)
+
+
+DEFAULT_ENTITLEMENT = Entitlement()
+
+
+def entitlement_from(subscription: Optional[dict]) -> Entitlement:
+    if not subscription:
+        return DEFAULT_ENTITLEMENT
+    return Entitlement(
+        plan_type=subscription.get("plan_type", "none"),
+        course_access=frozenset(subscription.get("course_access") or ()),
+        # Matches the UserSubscription model default for documents written without the flag
+        has_active_subscription=subscription.get("has_active_subscription", True),
+        subscription_tier=subscription.get("subscription_tier", "standard"),
+    )
+
+
+class EntitlementService:
+    """Per-user entitlements read from user_subscriptions and cached for ttl_seconds"""
+
+    def __init__(self, collection, ttl_seconds: float = 60.0, max_entries: int = 10000):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Entitlement, float]]" = OrderedDict()
+        self._epoch = 0
+
+    async def get(self, user_id: str) -> Entitlement:
+        cached = self._entries.get(user_id)
+        if cached is not None and time.monotonic() - cached[1] <= self.ttl_seconds:
+            self._entries.move_to_end(user_id)
+            return cached[0]
+
+        epoch = self._epoch
+        entitlement = entitlement_from(await self.collection.find_one({"user_id": user_id}, SUBSCRIPTION_FIELDS))
+        if epoch == self._epoch:
+            self._entries[user_id] = (entitlement, time.monotonic())
+            self._entries.move_to_end(user_id)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entitlement
+
+    def invalidate(self, user_id: Optional[str] = None):
+        """Drop one user's cached entitlement, or everyone's when no user is given."""
+        self._epoch += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
@@ -0,0 +1,295 @@
+"""
+Fuzzy Index
+Typo-tolerant lookup of short multi-word keys (glossary term names and
+aliases) by bounded edit distance, without scanning every key.
+
+Each query word is first corrected against the vocabulary of words used in
+keys (runs of letters and digits). Words of up to SHORT_WORD letters go
+through a deletion neighbourhood, where a word and every variant with up
+to two characters deleted point back at it; longer words have enough
+trigrams to filter on, and only the postings of their rarest trigrams are
+read. Keys are posted per (word, key
+length), so the candidates are the keys of compatible length containing a
+correction of every query word. The distance bound is widened one edit at
+a time, and each bound's candidates are verified with a banded
+optimal-string-alignment distance (Levenshtein plus adjacent
+transpositions, so "segergation" is one edit from "segregation").
+
+A query word that corrects to nothing is usually a typo on a space; it is
+split into the two words it runs together when it can be, and otherwise
+left to the words around it. Numbers are matched exactly or not at all.
+"""
+
+import re
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from keyword_matcher import normalize
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+GRAM = 3
+_PAD_START = "\x02" * (GRAM - 1)
+_PAD_END = "\x03" * (GRAM - 1)
+
+MAX_WORD_DISTANCE = 2
+# Up to this length two typos can leave a word too few intact trigrams to filter on
+SHORT_WORD = 10
+
+
+def trigrams(word: str) -> Set[str]:
+    padded = f"{_PAD_START}{word}{_PAD_END}"
+    return {padded[i:i + GRAM] for i in range(len(padded) - GRAM + 1)}
+
+
+def words_of(key: str) -> Set[str]:
+    return set(WORD_PATTERN.findall(key))
+
+
+def deletions(word: str, max_deletes: int) -> Set[str]:
+    """word plus every string obtained by deleting up to max_deletes of its characters."""
+    variants = {word}
+    for count in range(1, min(max_deletes, len(word)) + 1):
+        for positions in combinations(range(len(word)), count):
+            variants.add("".join(ch for i, ch in enumerate(word) if i not in positions))
+    return variants
+
+
+def default_max_distance(key: str) -> int:
+    """Edits tolerated for a query of this length: none for 1-2 characters, one for 3, two beyond."""
+    return 0 if len(key) <= 2 else 1 if len(key) == 3 else 2
+
+
+def word_max_distance(word: str) -> int:
+    """Edits tolerated within one query word: none for a single letter or a number, one up to 3 letters, two beyond."""
+    if word.isdigit():
+        # Form and section numbers ("1031", "1099") are never typos of each other
+        return 0
+    return 0 if len(word) <= 1 else 1 if len(word) <= 3 else 2
+
+
+def bounded_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Optimal string alignment distance between a and b, or None once it must exceed max_distance."""
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    # Typos are local, so most of both strings is a shared prefix and suffix that cannot add edits
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return len(a) + len(b)
+
+    beyond = max_distance + 1
+    # Only cells within max_distance of the diagonal can stay under the bound
+    before: Optional[List[int]] = None
+    previous = [j if j <= max_distance else beyond for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        ch = a[i - 1]
+        current = [i if i <= max_distance else beyond] + [beyond] * len(b)
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            value = previous[j - 1] if ch == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if before is not None and j > 1 and ch == b[j - 2] and a[i - 2] == b[j - 1] and before[j - 2] + 1 < value:
+                value = before[j - 2] + 1
+            if value > beyond:
+                value = beyond
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        before, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+
+class _Vocabulary:
+    """The distinct words of the indexed keys, searchable by edit distance"""
+
+    def __init__(self):
+        self.words: Dict[str, frozenset] = {}  # word -> its trigrams
+        self._grams: Dict[str, Set[str]] = defaultdict(set)
+        self._deletions: Dict[str, Set[str]] = defaultdict(set)
+
+    def add(self, word: str):
+        self.words[word] = frozenset(trigrams(word))
+        for gram in self.words[word]:
+            self._grams[gram].add(word)
+        if len(word) <= SHORT_WORD + MAX_WORD_DISTANCE:
+            for variant in deletions(word, MAX_WORD_DISTANCE):
+                self._deletions[variant].add(word)
+
+    def remove(self, word: str):
+        for gram in self.words.pop(word):
+            self._grams[gram].discard(word)
+            if not self._grams[gram]:
+                del self._grams[gram]
+        if len(word) <= SHORT_WORD + MAX_WORD_DISTANCE:
+            for variant in deletions(word, MAX_WORD_DISTANCE):
+                self._deletions[variant].discard(word)
+                if not self._deletions[variant]:
+                    del self._deletions[variant]
+
+    def _candidates(self, word: str, max_distance: int) -> Set[str]:
+        if len(word) <= SHORT_WORD:
+            # A match within max_distance reaches a shared variant with at most max_distance deletions on each side
+            return {
+                candidate
+                for variant in deletions(word, max_distance)
+                for candidate in self._deletions.get(variant, ())
+                if len(candidate) - len(variant) <= max_distance and abs(len(candidate) - len(word)) <= max_distance
+            }
+
+        # Each edit touches at most GRAM + 1 of a word's trigrams (a transposition spans one more),
+        # so a match shares `required` trigrams and so contains one of the len(grams) - required + 1 rarest
+        grams = trigrams(word)
+        required = len(grams) - (GRAM + 1) * max_distance
+        rarest = sorted(grams, key=lambda gram: len(self._grams.get(gram, ())))
+        candidates = set()
+        for gram in rarest[:len(grams) - required + 1]:
+            candidates |= self._grams.get(gram, set())
+        return {c for c in candidates if abs(len(c) - len(word)) <= max_distance and len(grams & self.words[c]) >= required}
+
+    def split(self, word: str) -> Optional[Tuple[str, str]]:
+        """Two vocabulary words that word runs together, with or without one stray character between them."""
+        for i in range(1, len(word)):
+            if word[:i] in self.words:
+                if word[i:] in self.words:
+                    return word[:i], word[i:]
+                if word[i + 1:] in self.words:
+                    return word[:i], word[i + 1:]
+        return None
+
+    def similar(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """(distance, vocabulary word) within max_distance edits of word."""
+        if word in self.words:
+            return [(0, word)]
+        if max_distance <= 0:
+            return []
+        matches = []
+        for candidate in self._candidates(word, max_distance):
+            distance = bounded_distance(word, candidate, max_distance)
+            if distance is not None:
+                matches.append((distance, candidate))
+        return matches
+
+
+class FuzzyIndex:
+    """Word-level fuzzy index from normalized keys to the values (e.g. term ids) they name"""
+
+    def __init__(self, entries: Iterable[Tuple[str, Hashable]] = ()):
+        self._keys: List[str] = []
+        self._key_ids: Dict[str, int] = {}
+        self._values: List[Set[Hashable]] = []
+        self._value_keys: Dict[Hashable, Set[int]] = defaultdict(set)
+        self._postings: Dict[Tuple[str, int], Set[int]] = defaultdict(set)  # (word, key length) -> key ids
+        self._word_uses: Dict[str, int] = defaultdict(int)
+        self._vocabulary = _Vocabulary()
+        for key, value in entries:
+            self.add(key, value)
+
+    def __len__(self) -> int:
+        return sum(1 for values in self._values if values)
+
+    def add(self, key: str, value: Hashable):
+        key = normalize(key)
+        if not key:
+            return
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = len(self._keys)
+            self._key_ids[key] = key_id
+            self._keys.append(key)
+            self._values.append(set())
+        if not self._values[key_id]:
+            for word in words_of(key):
+                self._postings[(word, len(key))].add(key_id)
+                self._word_uses[word] += 1
+                if self._word_uses[word] == 1:
+                    self._vocabulary.add(word)
+        self._values[key_id].add(value)
+        self._value_keys[value].add(key_id)
+
+    def remove(self, value: Hashable):
+        """Forget every key added for value; keys no other value uses leave the postings."""
+        for key_id in self._value_keys.pop(value, ()):
+            values = self._values[key_id]
+            values.discard(value)
+            if values:
+                continue
+            key = self._keys[key_id]
+            for word in words_of(key):
+                posting = self._postings[(word, len(key))]
+                posting.discard(key_id)
+                if not posting:
+                    del self._postings[(word, len(key))]
+                self._word_uses[word] -= 1
+                if not self._word_uses[word]:
+                    del self._word_uses[word]
+                    self._vocabulary.remove(word)
+
+    def _candidates(self, query: str, max_distance: int) -> Set[int]:
+        groups: List[List[str]] = []  # Each group lists the vocabulary words a key may use for one query word
+        spent = 0
+        for word in words_of(query):
+            corrections = self._vocabulary.similar(word, min(max_distance, word_max_distance(word)))
+            if corrections:
+                spent += min(distance for distance, _ in corrections)
+                groups.append([correction for _, correction in corrections])
+            elif word.isdigit():
+                return set()
+            else:
+                # A word matching nothing is usually a typo on a space: "taxplanning" or "entityjtrap"
+                # costs an edit and stands for the two words it runs together, or is left to the others
+                spent += 1
+                groups.extend([part] for part in self._vocabulary.split(word) or ())
+            if spent > max_distance:
+                return set()
+        if not groups:
+            return set()
+
+        lengths = range(len(query) - max_distance, len(query) + max_distance + 1)
+        per_group = []
+        for group in groups:
+            keys: Set[int] = set()
+            for correction in group:
+                for length in lengths:
+                    keys |= self._postings.get((correction, length), set())
+            if not keys:
+                return set()
+            per_group.append(keys)
+        per_group.sort(key=len)
+        return per_group[0].intersection(*per_group[1:])
+
+    def search(self, query: str, max_distance: Optional[int] = None, limit: int = 10) -> List[Tuple[int, str, Set[Hashable]]]:
+        """(distance, key, values) for the keys closest to query, at most max_distance edits away.
+
+        The bound widens one edit at a time and stops at the first distance with any match, so a
+        near-exact query never pays for the much larger distance-two neighbourhood. Every query word
+        must appear in the key, give or take word_max_distance(word) typos, except for words that
+        match nothing at all (typically a typo on a space).
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        if max_distance is None:
+            max_distance = default_max_distance(query)
+
+        matches = []
+        for bound in range(max_distance + 1):
+            for key_id in self._candidates(query, bound):
+                distance = bounded_distance(query, self._keys[key_id], bound)
+                if distance is not None:
+                    matches.append((distance, self._keys[key_id], self._values[key_id]))
+            if matches:
+                break
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return matches[:limit]
@@ -0,0 +1,178 @@
+"""
+Glossary View Bitsets
+Maps glossary term ids to dense integer ordinals (persisted in the
+`glossary_ordinals` collection) and stores each user's viewed terms as a
+bitset under `user_xp.viewed_glossary_bits`. The bitset is kept as 64-bit
+words keyed by word index so a term can be marked viewed with a single
+atomic $bit update and guarded with $bitsAllSet. A full reseed renumbers
+the terms; it bumps the glossary_ordinals stamp in catalog_versions, and
+every process reloads its cached assignments when it sees the new stamp.
+"""
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from bson.int64 import Int64
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from catalog_cache import bump_catalog_version
+
+BITS_FIELD = "viewed_glossary_bits"
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+ORDINALS_COLLECTION = "glossary_ordinals"
+COUNTERS_COLLECTION = "counters"
+
+
+def word_position(ordinal: int) -> Tuple[str, int]:
+    return str(ordinal // WORD_BITS), ordinal % WORD_BITS
+
+
+def decode_bits(words: Dict[str, int]) -> int:
+    """Fold stored 64-bit words into a single Python int bitset."""
+    bits = 0
+    for index, word in (words or {}).items():
+        bits |= (int(word) & WORD_MASK) << (WORD_BITS * int(index))
+    return bits
+
+
+def encode_bits(bits: int) -> Dict[str, Int64]:
+    """Split a Python int bitset into signed 64-bit words, omitting empty ones."""
+    words = {}
+    index = 0
+    while bits:
+        word = bits & WORD_MASK
+        if word:
+            words[str(index)] = Int64(word - (1 << WORD_BITS) if word >> (WORD_BITS - 1) else word)
+        bits >>= WORD_BITS
+        index += 1
+    return words
+
+
+def count_viewed(words: Dict[str, int]) -> int:
+    return sum(bin(int(word) & WORD_MASK).count("1") for word in (words or {}).values())
+
+
+def unviewed_filter(ordinal: int) -> dict:
+    """Query clause matching user_xp documents that have not viewed the term yet."""
+    index, bit = word_position(ordinal)
+    return {f"{BITS_FIELD}.{index}": {"$not": {"$bitsAllSet": [bit]}}}
+
+
+def mark_viewed_update(ordinals: Iterable[int]) -> dict:
+    """$bit update that sets the given ordinals in a user's bitset."""
+    masks: Dict[str, int] = {}
+    for ordinal in ordinals:
+        index, bit = word_position(ordinal)
+        masks[index] = masks.get(index, 0) | (1 << bit)
+    return {
+        f"{BITS_FIELD}.{index}": {"or": encode_bits(mask)["0"]}
+        for index, mask in masks.items()
+    }
+
+
+class GlossaryOrdinals:
+    """Stable term_id <-> ordinal assignments shared by every server process"""
+
+    def __init__(self, db, versions: Optional[Callable[[], Awaitable[Dict[str, int]]]] = None):
+        self.db = db
+        self._versions = versions
+        self.version: Optional[int] = None  # glossary_ordinals stamp the cached assignments were loaded under
+        self._by_term: Dict[str, int] = {}
+        self._by_ordinal: Dict[int, str] = {}
+
+    async def refresh(self) -> bool:
+        """Reload the assignments if a reseed renumbered them; True when cached ordinals went stale."""
+        if self._versions is None:
+            return False
+        version = (await self._versions()).get(ORDINALS_COLLECTION, 0)
+        if version == self.version:
+            return False
+        stale = self.version is not None
+        await self.load()
+        self.version = version
+        return stale
+
+    async def load(self):
+        assignments = await self.db[ORDINALS_COLLECTION].find().to_list(None)
+        self._by_term = {a["_id"]: a["ordinal"] for a in assignments}
+        self._by_ordinal = {a["ordinal"]: a["_id"] for a in assignments}
+
+    async def reset(self):
+        """Drop every assignment; only safe when user_xp is wiped at the same time."""
+        await self.db[ORDINALS_COLLECTION].delete_many({})
+        await self.db[COUNTERS_COLLECTION].delete_one({"_id": ORDINALS_COLLECTION})
+        # Other processes still hold the old numbering until they see the new stamp
+        await bump_catalog_version(self.db, ORDINALS_COLLECTION)
+        self._by_term.clear()
+        self._by_ordinal.clear()
+        self.version = None
+
+    async def ordinal(self, term_id: str) -> int:
+        """Return the term's ordinal, assigning the next free one on first use."""
+        await self.refresh()
+        if term_id in self._by_term:
+            return self._by_term[term_id]
+
+        assignment = await self.db[ORDINALS_COLLECTION].find_one({"_id": term_id})
+        if not assignment:
+            counter = await self.db[COUNTERS_COLLECTION].find_one_and_update(
+                {"_id": ORDINALS_COLLECTION},
+                {"$inc": {"seq": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            assignment = {"_id": term_id, "ordinal": counter["seq"] - 1}
+            try:
+                await self.db[ORDINALS_COLLECTION].insert_one(assignment)
+            except DuplicateKeyError:
+                # Another process assigned this term first; its ordinal wins
+                assignment = await self.db[ORDINALS_COLLECTION].find_one({"_id": term_id})
+
+        self._by_term[term_id] = assignment["ordinal"]
+        self._by_ordinal[assignment["ordinal"]] = term_id
+        return assignment["ordinal"]
+
+    async def assign_all(self, term_ids: Iterable[str]):
+        """Assign ordinals to many terms at once, reserving a contiguous block for new ones."""
+        await self.load()
+        missing = [t for t in dict.fromkeys(term_ids) if t not in self._by_term]
+        if not missing:
+            return
+        counter = await self.db[COUNTERS_COLLECTION].find_one_and_update(
+            {"_id": ORDINALS_COLLECTION},
+            {"$inc": {"seq": len(missing)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        first = counter["seq"] - len(missing)
+        try:
+            await self.db[ORDINALS_COLLECTION].insert_many(
+                [{"_id": term_id, "ordinal": first + i} for i, term_id in enumerate(missing)],
+                ordered=False
+            )
+        except BulkWriteError:
+            # Some terms were assigned concurrently elsewhere; the stored assignments win
+            pass
+        await self.load()
+
+    async def term_ids(self, bits: int) -> List[str]:
+        """Expand a bitset back into glossary term ids."""
+        await self.refresh()
+        ordinals = [i for i in range(bits.bit_length()) if bits >> i & 1]
+        if any(o not in self._by_ordinal for o in ordinals):
+            await self.load()
+        return [self._by_ordinal[o] for o in ordinals if o in self._by_ordinal]
+
+
+async def migrate_viewed_term_lists(db, ordinals: GlossaryOrdinals) -> int:
+    """Fold legacy user_xp.viewed_glossary_terms lists into bitsets; returns documents migrated."""
+    migrated = 0
+    async for user_xp in db.user_xp.find({"viewed_glossary_terms": {"$exists": True}}):
+        term_ids = user_xp.get("viewed_glossary_terms") or []
+        update = {"$unset": {"viewed_glossary_terms": ""}}
+        if term_ids:
+            update["$bit"] = mark_viewed_update([await ordinals.ordinal(t) for t in term_ids])
+        await db.user_xp.update_one({"_id": user_xp["_id"]}, update)
+        migrated += 1
+    return migrated
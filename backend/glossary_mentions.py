@@ -0,0 +1,84 @@
+"""
+Glossary Mention Index
+Precomputed map from glossary terms to the lessons that mention them, so
+"where is this covered?" is an indexed lookup instead of a $regex scan over
+every course's lesson content. One document per (term, course, lesson)
+records the first mention's character offset and the mention count.
+
+Course text is scanned with one Aho-Corasick pass over all term names and
+aliases. The whole collection is rebuilt when the glossary changes (at seed
+time); a changed course only re-indexes that course.
+"""
+
+from typing import Iterable, List, Optional
+
+from keyword_matcher import KeywordMatcher, normalize, term_aliases
+from seeding import swap_in_collection
+
+MENTIONS_COLLECTION = "glossary_mentions"
+
+
+def build_term_matcher(glossary: Iterable[dict]) -> KeywordMatcher:
+    """Match every glossary term name and alias, labelled with the normalized term name."""
+    return KeywordMatcher(
+        (alias, normalize(term["term"]))
+        for term in glossary if term.get("term")
+        for alias in term_aliases(term["term"])
+    )
+
+
+def course_mentions(course: dict, matcher: KeywordMatcher) -> List[dict]:
+    """Mention documents for one course: its lessons, plus the description under lesson_id None."""
+    sources = [(None, None, course.get("description") or "")]
+    sources += [(lesson.get("id"), lesson.get("title"), lesson.get("content") or "") for lesson in course.get("lessons", [])]
+
+    mentions = {}
+    for lesson_id, lesson_title, text in sources:
+        for start, _, term_key in matcher.matches(text):
+            mention = mentions.get((term_key, lesson_id))
+            if mention is None:
+                mentions[(term_key, lesson_id)] = {
+                    "term_key": term_key,
+                    "course_id": course["id"],
+                    "course_title": course.get("title", ""),
+                    "lesson_id": lesson_id,
+                    "lesson_title": lesson_title,
+                    "offset": start,
+                    "count": 1,
+                }
+            else:
+                mention["offset"] = min(mention["offset"], start)
+                mention["count"] += 1
+    return list(mentions.values())
+
+
+async def _load_matcher(db) -> KeywordMatcher:
+    return build_term_matcher(await db.glossary.find({}, {"_id": 0, "term": 1}).to_list(None))
+
+
+async def rebuild_mentions(db) -> int:
+    """Re-scan every course against the current glossary; returns mention documents written."""
+    matcher = await _load_matcher(db)
+    mentions = []
+    async for course in db.courses.find({}, {"_id": 0, "id": 1, "title": 1, "description": 1, "lessons": 1}):
+        mentions.extend(course_mentions(course, matcher))
+    await swap_in_collection(db, MENTIONS_COLLECTION, mentions)
+    return len(mentions)
+
+
+async def reindex_course(db, course_id: str, matcher: Optional[KeywordMatcher] = None) -> int:
+    """Replace one course's mentions after it changed (or was deleted); returns mentions written."""
+    matcher = matcher or await _load_matcher(db)
+    await db[MENTIONS_COLLECTION].delete_many({"course_id": course_id})
+    course = await db.courses.find_one({"id": course_id}, {"_id": 0, "id": 1, "title": 1, "description": 1, "lessons": 1})
+    mentions = course_mentions(course, matcher) if course else []
+    if mentions:
+        await db[MENTIONS_COLLECTION].insert_many(mentions)
+    return len(mentions)
+
+
+async def find_mentions(db, term: str, limit: int = 5) -> List[dict]:
+    """Lessons mentioning a term, most mentions first."""
+    return await db[MENTIONS_COLLECTION].find(
+        {"term_key": normalize(term)}, {"_id": 0}
+    ).sort([("count", -1), ("course_id", 1)]).limit(limit).to_list(limit)
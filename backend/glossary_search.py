@@ -0,0 +1,181 @@
+"""
+Glossary Search Index
+In-memory inverted token/prefix index over glossary terms so the search
+endpoint can rank results without a MongoDB round trip. Queries that match
+no token fall back to a typo-tolerant FuzzyIndex over term names and
+aliases, so "cost segergation" still finds Cost Segregation.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from fuzzy_index import FuzzyIndex
+from keyword_matcher import term_aliases
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Relative weight of a token hit in each indexed GlossaryTerm field
+FIELD_WEIGHTS = {
+    "term": 10.0,
+    "tags": 4.0,
+    "related_terms": 3.0,
+    "plain_english": 1.5,
+    "definition": 1.0,
+}
+
+# A prefix hit scores this fraction of a whole-token hit
+PREFIX_FACTOR = 0.5
+
+
+def tokenize(text: Any) -> List[str]:
+    """Split text (or a list of strings) into lowercase alphanumeric tokens."""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(t) for t in text)
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class GlossarySearchIndex:
+    """Inverted index mapping tokens and token prefixes to glossary term ids"""
+
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+        self._object_ids: Dict[Any, str] = {}
+        self._term_object_ids: Dict[str, Any] = {}
+        self._doc_tokens: Dict[str, Dict[str, float]] = {}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._prefixes: Dict[str, Set[str]] = defaultdict(set)
+        self._fuzzy = FuzzyIndex()
+        self.generation = 0  # Bumped on every change so dependent structures know to rebuild
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def build(self, documents: Iterable[dict]):
+        """Replace the index contents with the given glossary documents."""
+        self._docs.clear()
+        self._object_ids.clear()
+        self._term_object_ids.clear()
+        self._doc_tokens.clear()
+        self._postings.clear()
+        self._prefixes.clear()
+        self._fuzzy = FuzzyIndex()
+        self.generation += 1
+        for document in documents:
+            self.add(document)
+
+    def add(self, document: dict):
+        """Index a glossary document, replacing any previous version of it."""
+        term_id = document.get("id")
+        if not term_id:
+            return
+        self.remove(term_id)
+
+        doc = {k: v for k, v in document.items() if k != "_id"}
+        weights: Dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(doc.get(field)):
+                weights[token] += weight
+
+        self._docs[term_id] = doc
+        self.generation += 1
+        if "_id" in document:
+            self._object_ids[document["_id"]] = term_id
+            self._term_object_ids[term_id] = document["_id"]
+        self._doc_tokens[term_id] = dict(weights)
+        for alias in term_aliases(doc.get("term") or ""):
+            self._fuzzy.add(alias, term_id)
+        for token, weight in weights.items():
+            if token not in self._postings:
+                for i in range(1, len(token) + 1):
+                    self._prefixes[token[:i]].add(token)
+            self._postings[token][term_id] = weight
+
+    def remove(self, term_id: str):
+        """Drop a glossary term from the index if present."""
+        if self._docs.pop(term_id, None) is None:
+            return
+        self.generation += 1
+        self._fuzzy.remove(term_id)
+        object_id = self._term_object_ids.pop(term_id, None)
+        if object_id is not None:
+            self._object_ids.pop(object_id, None)
+        for token in self._doc_tokens.pop(term_id, {}):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(term_id, None)
+            if not posting:
+                del self._postings[token]
+                for i in range(1, len(token) + 1):
+                    prefix = token[:i]
+                    self._prefixes[prefix].discard(token)
+                    if not self._prefixes[prefix]:
+                        del self._prefixes[prefix]
+
+    def remove_by_object_id(self, object_id: Any):
+        """Drop a glossary term given its MongoDB _id (as reported by change streams)."""
+        term_id = self._object_ids.get(object_id)
+        if term_id:
+            self.remove(term_id)
+
+    def get(self, term_id: str) -> Optional[dict]:
+        return self._docs.get(term_id)
+
+    def documents(self) -> List[dict]:
+        return list(self._docs.values())
+
+    def term_names(self) -> Set[str]:
+        return {doc["term"] for doc in self._docs.values() if doc.get("term")}
+
+    def search(self, query: str, limit: int = 100) -> List[dict]:
+        """Return glossary documents matching every query token, best match first.
+
+        When no document matches, fall back to term names and aliases within a few typos.
+        """
+        if not tokenize(query):
+            return []
+        scores = self.token_scores(query)
+        if not scores:
+            return self.fuzzy_search(query, limit)
+        ranked = sorted(scores, key=lambda tid: (-scores[tid], self._docs[tid].get("term", "")))
+        return [self._docs[tid] for tid in ranked[:limit]]
+
+    def token_scores(self, query: str) -> Dict[str, float]:
+        """{term_id: score} for documents containing every query token (or a token it prefixes); no typo fallback."""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return {}
+
+        scores: Optional[Dict[str, float]] = None
+        for query_token in query_tokens:
+            token_scores: Dict[str, float] = defaultdict(float)
+            for token in self._prefixes.get(query_token, ()):
+                factor = 1.0 if token == query_token else PREFIX_FACTOR
+                for term_id, weight in self._postings[token].items():
+                    token_scores[term_id] = max(token_scores[term_id], weight * factor)
+            if scores is None:
+                scores = dict(token_scores)
+            else:
+                scores = {tid: s + token_scores[tid] for tid, s in scores.items() if tid in token_scores}
+            if not scores:
+                return {}
+
+        normalized_query = " ".join(query_tokens)
+        for term_id in scores:
+            term_name = " ".join(tokenize(self._docs[term_id].get("term")))
+            if term_name == normalized_query:
+                scores[term_id] += 100.0
+            elif term_name.startswith(normalized_query):
+                scores[term_id] += 50.0
+        return scores
+
+    def fuzzy_search(self, query: str, limit: int = 100) -> List[dict]:
+        """Glossary documents whose name or alias is within a few edits of query, closest first."""
+        results: Dict[str, dict] = {}
+        for _, _, term_ids in self._fuzzy.search(query, limit=limit):
+            for term_id in sorted(term_ids, key=lambda tid: self._docs[tid].get("term", "")):
+                results.setdefault(term_id, self._docs[term_id])
+        return list(results.values())[:limit]
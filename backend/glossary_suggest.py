@@ -0,0 +1,92 @@
+"""
+Glossary Suggestions
+Type-ahead for the glossary page without shipping the whole glossary to
+the client. Term names, the parts of "Full Name (ABBR)" names and tags are
+held in a PrefixIndex, along with every later word of a term name so
+"depr" also suggests Bonus Depreciation. A request reads only the slice
+matching the typed prefix and returns the top suggestions. Rendered
+responses are cached per (prefix, limit) and carry an ETag, and the whole
+cache is dropped when the glossary search index changes.
+"""
+
+import heapq
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from catalog_cache import CachedPayload, build_payload
+from glossary_search import GlossarySearchIndex
+from keyword_matcher import normalize, term_aliases
+from prefix_index import PrefixIndex
+
+DEFAULT_SUGGESTIONS = 10
+MAX_SUGGESTIONS = 50
+MAX_PREFIX_LENGTH = 64
+
+# Rank of each way a suggestion can match, best first
+NAME, ALIAS, TAG, NAME_WORD = range(4)
+KIND_NAMES = {NAME: "term", ALIAS: "alias", TAG: "tag", NAME_WORD: "term"}
+
+
+def suggestion_entries(documents: List[dict]) -> List[Tuple[str, Tuple[int, str, Optional[str], Optional[str]]]]:
+    """PrefixIndex entries (key, (rank, text, term_id, term)) for glossary documents."""
+    entries = []
+    for doc in documents:
+        name = doc.get("term")
+        if not name:
+            continue
+        entries.append((normalize(name), (NAME, name, doc.get("id"), name)))
+        for alias in term_aliases(name)[1:]:
+            entries.append((normalize(alias), (ALIAS, alias, doc.get("id"), name)))
+        words = normalize(name).split(" ")
+        for start in range(1, len(words)):
+            entries.append((" ".join(words[start:]), (NAME_WORD, name, doc.get("id"), name)))
+        for tag in doc.get("tags") or ():
+            entries.append((normalize(str(tag)), (TAG, str(tag), None, None)))
+    return entries
+
+
+class GlossarySuggester:
+    """Prefix suggestions over a GlossarySearchIndex, rebuilt whenever the index changes"""
+
+    def __init__(self, index: GlossarySearchIndex, max_cached: int = 4096):
+        self._index = index
+        self.max_cached = max_cached
+        self._generation = None
+        self._prefixes: Optional[PrefixIndex] = None
+        self._payloads: "OrderedDict[Tuple[str, int], CachedPayload]" = OrderedDict()
+
+    def _current(self) -> PrefixIndex:
+        if self._prefixes is None or self._generation != self._index.generation:
+            self._generation = self._index.generation
+            self._prefixes = PrefixIndex(suggestion_entries(self._index.documents()))
+            self._payloads.clear()
+        return self._prefixes
+
+    def suggest(self, prefix: str, limit: int = DEFAULT_SUGGESTIONS) -> List[dict]:
+        """Top suggestions for a typed prefix: whole names first, then aliases, tags and later words of names."""
+        key = normalize(prefix[:MAX_PREFIX_LENGTH])
+        if not key:
+            return []
+        best: Dict[Tuple[str, str], Tuple[int, str, Optional[str], Optional[str]]] = {}
+        for _, suggestion in self._current().matches(key):
+            rank, text, term_id, _ = suggestion
+            # A term is suggested once, by its best match; a tag once however many terms carry it
+            dedupe = ("term", term_id) if term_id else ("tag", normalize(text))
+            if dedupe not in best or rank < best[dedupe][0]:
+                best[dedupe] = suggestion
+        top = heapq.nsmallest(limit, best.values(), key=lambda s: (s[0], len(s[1]), s[1].lower()))
+        return [{"text": text, "kind": KIND_NAMES[rank], "term_id": term_id, "term": term} for rank, text, term_id, term in top]
+
+    def payload(self, prefix: str, limit: int = DEFAULT_SUGGESTIONS) -> CachedPayload:
+        """suggest() rendered as a cached, ETagged response body."""
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        self._current()
+        cache_key = (normalize(prefix[:MAX_PREFIX_LENGTH]), limit)
+        payload = self._payloads.get(cache_key)
+        if payload is None:
+            payload = build_payload(self._generation, self.suggest(prefix, limit))
+            self._payloads[cache_key] = payload
+            if len(self._payloads) > self.max_cached:
+                self._payloads.popitem(last=False)
+        self._payloads.move_to_end(cache_key)
+        return payload
@@ -0,0 +1,134 @@
+"""
+Keyword Matcher
+A single Aho-Corasick automaton over every keyword the chat pipeline looks
+for (glossary terms, module keywords, premium topics and QGPT intents), so
+a message is scanned once no matter how many keywords there are. Matches
+must start and end on word boundaries, which keeps "str" from matching
+inside "strategy". Hyphens and runs of whitespace are treated alike, so
+"split-dollar" also matches "split dollar".
+"""
+
+import re
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, List, Set, Tuple
+
+if TYPE_CHECKING:  # glossary_search imports this module for normalize()
+    from glossary_search import GlossarySearchIndex
+
+SEPARATORS = re.compile(r"[\s\-]+")
+ABBREVIATED_NAME = re.compile(r"^(.*?)\s*\(([^)]+)\)$")
+
+Label = Hashable
+
+
+def normalize(text: str) -> str:
+    return SEPARATORS.sub(" ", text.lower()).strip()
+
+
+def normalize_with_positions(text: str) -> Tuple[str, List[int]]:
+    """normalize() plus, for each normalized character, its index in the original text."""
+    chars: List[str] = []
+    positions: List[int] = []
+    for i, ch in enumerate(text):
+        if ch.isspace() or ch == "-":
+            if chars and chars[-1] != " ":
+                chars.append(" ")
+                positions.append(i)
+            continue
+        for lowered in ch.lower():
+            chars.append(lowered)
+            positions.append(i)
+    if chars and chars[-1] == " ":
+        chars.pop()
+        positions.pop()
+    return "".join(chars), positions
+
+
+def term_aliases(name: str) -> List[str]:
+    """A glossary term name plus the parts of "Full Name (ABBR)" people actually type."""
+    match = ABBREVIATED_NAME.match(name.strip())
+    return [name, match.group(1), match.group(2)] if match else [name]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton mapping normalized keywords to labels"""
+
+    def __init__(self, keywords: Iterable[Tuple[str, Label]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Label]]] = [[]]  # (keyword length, label) ending at each node
+        for keyword, label in keywords:
+            self._insert(normalize(keyword), label)
+        self._link()
+
+    def _insert(self, key: str, label: Label):
+        if not key:
+            return
+        node = 0
+        for ch in key:
+            child = self._goto[node].get(ch)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][ch] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = child
+        self._out[node].append((len(key), label))
+
+    def _link(self):
+        """Breadth-first pass that sets failure links and merges outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def matches(self, text: str) -> List[Tuple[int, int, Label]]:
+        """Every whole-word keyword occurrence as (start, end, label) offsets into the original text, overlaps included."""
+        text, positions = normalize_with_positions(text)
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, label in self._out[node]:
+                start = i - length + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (i + 1 == len(text) or not text[i + 1].isalnum()):
+                    hits.append((positions[start], positions[i] + 1, label))
+        return hits
+
+    def labels(self, text: str) -> Set[Label]:
+        return {label for _, _, label in self.matches(text)}
+
+
+class GlossaryKeywordMatcher:
+    """A KeywordMatcher over a static keyword table plus live glossary term names, rebuilt when the index changes"""
+
+    def __init__(self, keywords: Iterable[Tuple[str, Label]], index: "GlossarySearchIndex", label_kind: str = "glossary"):
+        self._keywords = list(keywords)
+        self._index = index
+        self._label_kind = label_kind
+        self._generation = None
+        self._matcher = None
+
+    def _current(self) -> KeywordMatcher:
+        if self._matcher is None or self._generation != self._index.generation:
+            glossary_keywords = [
+                (alias, (self._label_kind, name))
+                for name in self._index.term_names()
+                for alias in term_aliases(name)
+            ]
+            self._generation = self._index.generation
+            self._matcher = KeywordMatcher(self._keywords + glossary_keywords)
+        return self._matcher
+
+    def labels(self, text: str) -> Set[Label]:
+        return self._current().labels(text)
@@ -0,0 +1,29 @@
+"""
+Prefix Index
+A compact sorted array of (key, payload) entries. Every entry whose key
+starts with a prefix sits in one contiguous slice, found by bisecting on
+the prefix, so a lookup costs O(log n) plus the size of the slice.
+"""
+
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator, List, Tuple
+
+
+class PrefixIndex:
+    """Sorted keys with a parallel payload array, searched by prefix"""
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]]):
+        ordered = sorted(entries, key=lambda entry: entry[0])
+        self._keys: List[str] = [key for key, _ in ordered]
+        self._payloads: List[Any] = [payload for _, payload in ordered]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def matches(self, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """(key, payload) for every key starting with prefix, in key order."""
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[position]
+            if not key.startswith(prefix):
+                return
+            yield key, self._payloads[position]
@@ -0,0 +1,109 @@
+"""
+Progress Store
+Lesson progress is one document per (user_id, course_id, lesson_id),
+enforced by a unique index and written only through atomic upserts, so
+repeated or concurrent saves update that document instead of appending
+duplicates. collapse_duplicate_progress merges the duplicates older code
+left behind so the unique index can be built.
+"""
+
+import logging
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_KEY = ("user_id", "course_id", "lesson_id")
+MAX_PROGRESS_DOCUMENTS = 1000
+
+
+def _key(user_id: str, course_id: str, lesson_id: str) -> dict:
+    return {"user_id": user_id, "course_id": course_id, "lesson_id": lesson_id}
+
+
+async def _upsert(db, key: dict, update: dict, **kwargs):
+    try:
+        return await db.user_progress.find_one_and_update(key, update, upsert=True, **kwargs)
+    except DuplicateKeyError:
+        # Two first saves raced; the loser's insert hit the unique index, so retry as an update
+        return await db.user_progress.find_one_and_update(key, update, upsert=True, **kwargs)
+
+
+async def load_progress(db, user_id: str) -> List[dict]:
+    return await db.user_progress.find({"user_id": user_id}, {"_id": 0}).to_list(MAX_PROGRESS_DOCUMENTS)
+
+
+async def save_progress(db, progress: dict) -> dict:
+    """Insert or update the progress document for progress's (user, course, lesson).
+
+    progress holds only the fields the client sent: absent or None fields leave the stored values
+    alone, so a save cannot mark a finished lesson incomplete by omission, and the score only ever
+    rises, so it cannot erase the best score that complete_lesson awards XP against.
+    """
+    key = {field: progress[field] for field in PROGRESS_KEY}
+    fields = {
+        k: v for k, v in progress.items()
+        if k not in PROGRESS_KEY and k not in ("id", "_id", "score") and v is not None
+    }
+    update = {"$setOnInsert": {"id": progress.get("id") or str(uuid.uuid4())}}
+    if fields:
+        update["$set"] = fields
+    if progress.get("score") is not None:
+        update["$max"] = {"score": progress["score"]}
+    return await _upsert(
+        db, key, update,
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+
+
+async def complete_lesson(db, user_id: str, course_id: str, lesson_id: str, score: int) -> Optional[int]:
+    """Mark a lesson complete keeping the best score; returns the previous best, if any."""
+    previous = await _upsert(
+        db, _key(user_id, course_id, lesson_id),
+        {
+            "$set": {"completed": True, "completed_at": datetime.utcnow()},
+            "$max": {"score": score},
+            "$setOnInsert": {"id": str(uuid.uuid4())}
+        },
+        projection={"_id": 0, "score": 1},
+        return_document=ReturnDocument.BEFORE
+    )
+    return (previous or {}).get("score")
+
+
+async def collapse_duplicate_progress(db) -> int:
+    """Merge duplicate progress documents per key and drop a non-unique key index; returns documents removed."""
+    removed = 0
+    duplicates = db.user_progress.aggregate([
+        {"$sort": {"_id": 1}},
+        {"$group": {
+            "_id": {field: f"${field}" for field in PROGRESS_KEY},
+            "ids": {"$push": "$_id"},
+            "completed": {"$max": {"$ifNull": ["$completed", False]}},
+            "score": {"$max": "$score"},
+            "completed_at": {"$min": "$completed_at"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    async for group in duplicates:
+        keep, *extra = group["ids"]
+        await db.user_progress.update_one({"_id": keep}, {"$set": {
+            "completed": group["completed"],
+            "score": group["score"],
+            "completed_at": group["completed_at"],
+        }})
+        result = await db.user_progress.delete_many({"_id": {"$in": extra}})
+        removed += result.deleted_count
+
+    # An index on the key built before it was unique has to go so the unique one can replace it
+    for name, info in (await db.user_progress.index_information()).items():
+        if tuple(k for k, _ in info["key"]) == PROGRESS_KEY and not info.get("unique"):
+            await db.user_progress.drop_index(name)
+            logger.info(f"Dropped non-unique progress index {name}")
+    return removed
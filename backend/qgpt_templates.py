@@ -0,0 +1,74 @@
+"""
+QGPT Response Templates
+Strategy answers are data in qgpt_strategies.json: each strategy lists the
+keywords that select it (in priority order), the minimum access tier that
+sees it, and either section fields or a ready-written body. The file is
+read once and every answer is pre-rendered into response sections per
+(strategy, access_tier), so answering a strategy question is one dict
+lookup. Users below a strategy's tier get that tier's gate message.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+STRATEGIES_FILE = Path(__file__).parent / 'qgpt_strategies.json'
+SUPPORTED_FORMAT = 1
+ACCESS_TIERS = ("none", "standard", "all_access")
+
+
+class TemplateError(Exception):
+    pass
+
+
+def access_tier(has_subscription: bool, has_full_access: bool) -> str:
+    if has_full_access:
+        return "all_access"
+    return "standard" if has_subscription else "none"
+
+
+def split_paragraphs(text: str) -> Iterator[str]:
+    """Split a response into streamable chunks that join back to the original text"""
+    for i, paragraph in enumerate(text.split("\n\n")):
+        yield paragraph if i == 0 else "\n\n" + paragraph
+
+
+@dataclass(frozen=True)
+class TemplateRegistry:
+    intents: Tuple[Tuple[str, Tuple[str, ...]], ...]  # (strategy id, keywords) in priority order
+    responses: Dict[Tuple[str, str], Tuple[str, ...]]
+    gates: Dict[str, Tuple[str, ...]]
+
+    def sections(self, strategy: str, tier: str) -> Optional[Tuple[str, ...]]:
+        return self.responses.get((strategy, tier))
+
+
+def _render(strategy: dict, sections) -> Tuple[str, ...]:
+    if "body" in strategy:
+        return tuple(split_paragraphs(strategy["body"]))
+    return (strategy["title"],) + tuple(
+        f"\n\n**{section['heading']}:** {strategy[section['field']]}" for section in sections
+    )
+
+
+def load_templates(path: Path = STRATEGIES_FILE) -> TemplateRegistry:
+    """Read the strategy file and pre-render every (strategy, access_tier) response."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != SUPPORTED_FORMAT:
+        raise TemplateError(f"Unsupported QGPT template format {data.get('format')} in {path}")
+
+    gates = {tier: tuple(split_paragraphs(text)) for tier, text in data["gates"].items()}
+    intents = []
+    responses = {}
+    for strategy in data["strategies"]:
+        try:
+            rendered = _render(strategy, data["sections"])
+            required = ACCESS_TIERS.index(strategy.get("min_tier", "standard"))
+        except (KeyError, ValueError) as e:
+            raise TemplateError(f"Invalid QGPT strategy {strategy.get('id')!r}: {e}")
+        intents.append((strategy["id"], tuple(strategy["keywords"])))
+        for rank, tier in enumerate(ACCESS_TIERS):
+            responses[(strategy["id"], tier)] = rendered if rank >= required else gates[tier]
+    return TemplateRegistry(intents=tuple(intents), responses=responses, gates=gates)
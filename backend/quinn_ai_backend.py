@@ -15,6 +15,12 @@ from dotenv import load_dotenv
 from pathlib import Path
 from pydantic import BaseModel, Field
 
+from catalog_cache import CatalogCache
+from glossary_bitset import BITS_FIELD, count_viewed
+from glossary_mentions import find_mentions
+from progress_store import load_progress
+from term_resolver import TermResolver
+
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
@@ -23,6 +29,10 @@ load_dotenv(ROOT_DIR / '.env')
 mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
+catalog_versions = CatalogCache(db, check_interval=float(os.environ.get('CATALOG_VERSION_CHECK_SECONDS', '5')))
+
+# Looser edit distance for "did you mean" suggestions when no term resolves
+SIMILAR_TERM_DISTANCE = 3
 
 # Quinn AI Models
 class QuinnRequest(BaseModel):
@@ -77,6 +87,9 @@ class QuinnAIProcessor:
             'how to use', 'build', 'calculate', 'plan'
         ]
 
+        self._term_resolver: Optional[TermResolver] = None
+        self._term_resolver_version: Optional[int] = None
+
     async def process_request(self, request: QuinnRequest) -> QuinnResponse:
         """Main request processing logic"""
         
@@ -161,18 +174,10 @@ class QuinnAIProcessor:
         search_term = await self._extract_term_from_message(message_lower)
         
         if search_term:
-            # Search for the term in glossary
-            terms = await db.glossary.find({
-                "$or": [
-                    {"term": {"$regex": search_term, "$options": "i"}},
-                    {"definition": {"$regex": search_term, "$options": "i"}},
-                    {"tags": {"$in": [search_term.lower()]}}
-                ]
-            }).to_list(5)
+            resolver = await self._get_term_resolver()
+            best_term = resolver.resolve(search_term)
             
-            if terms:
-                best_term = terms[0]  # Take the best match
-                
+            if best_term:
                 response_text = f"**{best_term['term']}**\n\n"
                 response_text += f"**Definition:** {best_term['definition']}\n\n"
                 
@@ -208,12 +213,7 @@ class QuinnAIProcessor:
                 response_text = f"I couldn't find a specific definition for '{search_term}', but let me suggest some related terms that might help:\n\n"
                 
                 # Find similar terms
-                similar_terms = await db.glossary.find({
-                    "$or": [
-                        {"term": {"$regex": ".*" + search_term + ".*", "$options": "i"}},
-                        {"definition": {"$regex": ".*" + search_term + ".*", "$options": "i"}}
-                    ]
-                }).to_list(3)
+                similar_terms = resolver.rank(search_term, limit=3, max_distance=SIMILAR_TERM_DISTANCE)
                 
                 if similar_terms:
                     for term in similar_terms:
@@ -243,7 +243,7 @@ class QuinnAIProcessor:
         message_lower = request.message.lower()
         
         # Get user progress
-        user_progress = await db.user_progress.find({"user_id": request.user_id}).to_list(100)
+        user_progress = await load_progress(db, request.user_id)
         completed_courses = {p['course_id'] for p in user_progress if p.get('completed', False)}
         
         # Get all courses
@@ -445,11 +445,11 @@ class QuinnAIProcessor:
         """Handle progress and tracking requests"""
         
         # Get user progress and XP
-        user_progress = await db.user_progress.find({"user_id": request.user_id}).to_list(100)
+        user_progress = await load_progress(db, request.user_id)
         user_xp = await db.user_xp.find_one({"user_id": request.user_id})
         
         if not user_xp:
-            user_xp = {"total_xp": 0, "glossary_xp": 0, "quiz_xp": 0, "viewed_glossary_terms": []}
+            user_xp = {"total_xp": 0, "glossary_xp": 0, "quiz_xp": 0, BITS_FIELD: {}}
         
         # Get course completion stats
         courses = await db.courses.find().to_list(10)
@@ -475,7 +475,7 @@ class QuinnAIProcessor:
         response_text += f"**XP Earned:** {user_xp['total_xp']} total points\n"
         response_text += f"• Course/Quiz XP: {user_xp.get('quiz_xp', 0)}\n"
         response_text += f"• Glossary XP: {user_xp.get('glossary_xp', 0)}\n"
-        response_text += f"• Unique terms viewed: {len(user_xp.get('viewed_glossary_terms', []))}\n\n"
+        response_text += f"• Unique terms viewed: {count_viewed(user_xp.get(BITS_FIELD))}\n\n"
         
         if completed_courses:
             response_text += f"**✅ Completed Courses ({len(completed_courses)}):**\n"
@@ -582,6 +582,15 @@ class QuinnAIProcessor:
             )
 
     # Helper methods
+    async def _get_term_resolver(self) -> TermResolver:
+        """In-memory glossary resolver, reloaded only when the glossary's catalog version changes"""
+        version = (await catalog_versions.versions()).get("glossary", 0)
+        if self._term_resolver is None or version != self._term_resolver_version:
+            terms = await db.glossary.find({}, {"_id": 0}).to_list(None)
+            self._term_resolver = TermResolver(terms)
+            self._term_resolver_version = version
+        return self._term_resolver
+
     async def _extract_term_from_message(self, message: str) -> str:
         """Extract potential glossary term from user message"""
         # Remove common question words
@@ -598,15 +607,20 @@ class QuinnAIProcessor:
         return potential_term if len(potential_term) > 1 else ""
 
     async def _find_courses_mentioning_term(self, term: str) -> List[Dict[str, str]]:
-        """Find courses that mention a specific term"""
-        courses = await db.courses.find({
-            "$or": [
-                {"lessons.content": {"$regex": term, "$options": "i"}},
-                {"description": {"$regex": term, "$options": "i"}}
-            ]
-        }).to_list(5)
-        
-        return [{"title": c['title'], "id": c['id'], "type": "course"} for c in courses]
+        """Find the lessons (or course descriptions) that mention a term, via the mention index"""
+        links = []
+        for mention in await find_mentions(db, term, limit=5):
+            if mention["lesson_id"]:
+                links.append({
+                    "title": f"{mention['course_title']}: {mention['lesson_title']}",
+                    "id": mention["course_id"],
+                    "lesson_id": mention["lesson_id"],
+                    "offset": str(mention["offset"]),
+                    "type": "lesson"
+                })
+            else:
+                links.append({"title": mention["course_title"], "id": mention["course_id"], "type": "course"})
+        return links
 
     async def _generate_w2_strategy_response(self, request: QuinnRequest) -> Dict[str, Any]:
         """Generate W-2 specific strategy advice"""
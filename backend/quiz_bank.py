@@ -0,0 +1,105 @@
+"""
+Quiz Bank
+Questions for each (course_id, module_id) are loaded once into an
+array-backed bank. Option shuffles for a whole quiz are drawn as one batch
+of NumPy permutations from a per-request seed, so a quiz can be replayed
+exactly by passing the same seed back. Answers and explanations stay on
+the server; clients get questions through without_answers().
+"""
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+BankKey = Tuple[str, Optional[int]]
+
+# Fields that would give the answer away; grading responses return them instead
+ANSWER_FIELDS = ("correct_answer", "correct_answer_index", "explanation")
+
+
+def without_answers(questions: List[dict]) -> List[dict]:
+    """Copies of questions safe to send to a client taking the quiz."""
+    return [{k: v for k, v in q.items() if k not in ANSWER_FIELDS} for q in questions]
+
+
+def lesson_for_module(lessons: List[dict], quiz_module_ids: Iterable[int], module_id: int) -> Optional[dict]:
+    """The lesson a course's quiz module covers, or None.
+
+    Courses number quiz modules and lesson order_index independently (the Blueprint quizzes modules
+    1-5 over lessons 0-5, W-2 numbers both from 1, Business both from 0), so the first quiz module
+    is aligned with the first lesson. Where lessons share an order_index the last one listed wins.
+    """
+    module_ids = [m for m in quiz_module_ids if m is not None]
+    orders = [l["order_index"] for l in lessons if l.get("order_index") is not None]
+    if not module_ids or not orders:
+        return None
+    order_index = module_id - min(module_ids) + min(orders)
+    matches = [l for l in lessons if l.get("order_index") == order_index]
+    return matches[-1] if matches else None
+
+
+class QuizBank:
+    """Validated questions plus the arrays needed to shuffle them in one pass"""
+
+    def __init__(self, questions: List[dict]):
+        self.questions = questions
+        self.by_id = {q["id"]: q for q in questions}
+        self.options = [q.get("options") or [] for q in questions]
+        self.option_counts = np.array([len(opts) for opts in self.options], dtype=np.int64)
+        self.max_options = int(self.option_counts.max()) if questions else 0
+        # Original position of the correct answer, or -1 when it cannot be shuffled
+        self.correct_positions = np.array([
+            opts.index(q["correct_answer"]) if q.get("correct_answer") in opts else -1
+            for q, opts in zip(questions, self.options)
+        ], dtype=np.int64)
+        self._padding = np.arange(self.max_options)[None, :] >= self.option_counts[:, None]
+
+    def permutations(self, seed: int) -> np.ndarray:
+        """One row per question: a permutation of its option indexes, padded at the end."""
+        rng = np.random.default_rng(seed)
+        keys = rng.random((len(self.questions), self.max_options))
+        keys[self._padding] = np.inf
+        return np.argsort(keys, axis=1, kind="stable")
+
+    def shuffled(self, seed: int) -> List[dict]:
+        """Questions with options reordered for this seed and correct_answer_index updated."""
+        if not self.max_options:
+            return list(self.questions)
+        permutations = self.permutations(seed)
+        correct_indexes = np.argmax(permutations == self.correct_positions[:, None], axis=1)
+
+        shuffled = []
+        for i, question in enumerate(self.questions):
+            if self.correct_positions[i] < 0:
+                shuffled.append(question)
+                continue
+            options = self.options[i]
+            order = permutations[i, :self.option_counts[i]].tolist()
+            correct_index = int(correct_indexes[i])
+            shuffled.append({
+                **question,
+                "options": [options[j] for j in order],
+                "correct_answer_index": correct_index,
+                "correct_answer": options[order[correct_index]],  # Keep text for backward compatibility
+            })
+        return shuffled
+
+
+class QuizBankCache:
+    """Loads each bank once and reloads it only when the quiz_questions version changes"""
+
+    def __init__(self, versions: Callable[[], Awaitable[Dict[str, int]]]):
+        self._versions = versions
+        self._banks: Dict[BankKey, Tuple[int, QuizBank]] = {}
+
+    async def get(self, key: BankKey, loader: Callable[[], Awaitable[List[dict]]]) -> QuizBank:
+        version = (await self._versions()).get("quiz_questions", 0)
+        cached = self._banks.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        bank = QuizBank(await loader())
+        self._banks[key] = (version, bank)
+        return bank
+
+    def invalidate(self):
+        self._banks.clear()
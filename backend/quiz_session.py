@@ -0,0 +1,125 @@
+"""
+Quiz Sessions
+Stateless, encrypted quiz session tokens. get_course_quiz issues one per
+shuffled quiz carrying the question order and the answer key for that
+shuffle, so answers can be graded by option index in memory without
+looking the questions up again. Tokens are Fernet tokens (AES-CBC plus
+HMAC-SHA256), so clients can neither read the answer key nor alter it.
+Each token carries a session id that QuizSessionLedger records once the
+session reveals an answer or is graded, so a token that has shown answers
+cannot be replayed for full marks.
+"""
+
+import base64
+import hashlib
+import json
+import secrets
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+from pymongo.errors import DuplicateKeyError
+
+TOKEN_VERSION = 3
+
+
+class QuizSessionError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class QuizSession:
+    session_id: str
+    course_id: str
+    module_id: Optional[int]
+    question_ids: Tuple[str, ...]
+    answer_key: Tuple[int, ...]
+    points: Tuple[int, ...]
+    issued_at: int
+
+    def grade(self, question_id: str, answer_index: Optional[int]) -> Tuple[bool, int, int]:
+        """Return (correct, points earned, correct index) for one answer."""
+        try:
+            position = self.question_ids.index(question_id)
+        except ValueError:
+            raise QuizSessionError(f"Question {question_id} is not part of this quiz session")
+        correct_index = self.answer_key[position]
+        correct = answer_index is not None and answer_index == correct_index
+        return correct, self.points[position] if correct else 0, correct_index
+
+
+class QuizSessionCipher:
+    """Issues and verifies encrypted quiz session tokens"""
+
+    def __init__(self, secret: str, ttl_seconds: int = 86400):
+        if not secret:
+            # Every worker must share the secret, or tokens fail to verify on the next request or restart
+            raise ValueError("A quiz session secret is required")
+        self._fernet = Fernet(base64.urlsafe_b64encode(hashlib.sha256(secret.encode("utf-8")).digest()))
+        self.ttl_seconds = ttl_seconds
+
+    def issue(self, course_id: str, module_id: Optional[int], questions: List[dict]) -> str:
+        """Create a token for an already shuffled list of questions."""
+        body = {
+            "v": TOKEN_VERSION,
+            "j": secrets.token_urlsafe(12),
+            "c": course_id,
+            "m": module_id,
+            "q": [q["id"] for q in questions],
+            "a": [q.get("correct_answer_index") for q in questions],
+            "p": [q.get("points", 0) for q in questions],
+            "t": int(time.time()),
+        }
+        return self._fernet.encrypt(json.dumps(body, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+    def verify(self, token: str) -> QuizSession:
+        """Authenticate and decrypt the token, then check its expiry."""
+        try:
+            body = json.loads(self._fernet.decrypt((token or "").encode("utf-8")))
+        except (InvalidToken, ValueError):
+            raise QuizSessionError("Invalid quiz session")
+        if body.get("v") != TOKEN_VERSION:
+            raise QuizSessionError("Unsupported quiz session version")
+        if time.time() - body["t"] > self.ttl_seconds:
+            raise QuizSessionError("Quiz session expired")
+        return QuizSession(
+            session_id=body["j"],
+            course_id=body["c"],
+            module_id=body["m"],
+            question_ids=tuple(body["q"]),
+            answer_key=tuple(body["a"]),
+            points=tuple(body["p"]),
+            issued_at=body["t"],
+        )
+
+
+class QuizSessionLedger:
+    """Which quiz sessions have revealed answers or been graded, shared by every worker through MongoDB"""
+
+    def __init__(self, collection, ttl_seconds: int = 86400):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+
+    def _expires_at(self, session: QuizSession) -> datetime:
+        # Past the token's own expiry the record is useless, so a TTL index can drop it
+        return datetime.utcfromtimestamp(session.issued_at + self.ttl_seconds)
+
+    async def reveal(self, session: QuizSession):
+        """Note that the session has shown a correct answer; it can no longer be graded."""
+        await self.collection.update_one(
+            {"_id": session.session_id},
+            {"$setOnInsert": {"use": "revealed", "expires_at": self._expires_at(session)}},
+            upsert=True
+        )
+
+    async def consume(self, session: QuizSession) -> bool:
+        """Claim the session for a single grading; False if it was graded or revealed answers before."""
+        try:
+            await self.collection.insert_one(
+                {"_id": session.session_id, "use": "graded", "expires_at": self._expires_at(session)}
+            )
+        except DuplicateKeyError:
+            return False
+        return True
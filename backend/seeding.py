@@ -0,0 +1,88 @@
+"""
+Seeding Pipeline
+Loads seed documents into MongoDB without ever exposing an empty catalog.
+
+- full mode builds each collection in a staging collection with
+  insert_many(ordered=False), indexes it, and swaps it over the live one
+  with renameCollection(dropTarget=True).
+- diff mode compares the seed documents with what is stored (matched by
+  `id`) and applies only inserts, replacements and deletions in a single
+  unordered bulk_write, which is the fast path for reseeding production.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from pymongo import DeleteMany, ReplaceOne
+
+from db_indexes import REQUIRED_INDEXES, ensure_indexes
+
+STAGING_SUFFIX = "__staging"
+
+# Fields regenerated on every seed run; differences in them alone do not count as a change
+VOLATILE_FIELDS = {"_id", "created_at", "last_updated"}
+
+
+@dataclass
+class SeedResult:
+    collection: str
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    changed_ids: List[str] = field(default_factory=list)  # ids inserted, updated or deleted by a diff sync
+
+
+def _comparable(document: dict) -> dict:
+    return {k: v for k, v in document.items() if k not in VOLATILE_FIELDS}
+
+
+async def swap_in_collection(db, name: str, documents: List[dict]) -> SeedResult:
+    """Replace a collection wholesale via a fully built and indexed staging collection."""
+    staging = db[name + STAGING_SUFFIX]
+    await staging.drop()
+    if not documents:
+        result = await db[name].delete_many({})
+        return SeedResult(collection=name, deleted=result.deleted_count)
+
+    await staging.insert_many(documents, ordered=False)
+    # renameCollection replaces the target's indexes with the staging ones, so build them first
+    if name in REQUIRED_INDEXES:
+        await ensure_indexes(db, {staging.name: REQUIRED_INDEXES[name]})
+    await staging.rename(name, dropTarget=True)
+    return SeedResult(collection=name, inserted=len(documents))
+
+
+async def sync_collection(db, name: str, documents: List[dict]) -> SeedResult:
+    """Upsert only new or changed documents and delete ones no longer seeded."""
+    result = SeedResult(collection=name)
+    stored: Dict[str, dict] = {
+        doc["id"]: doc for doc in await db[name].find({}, {"_id": 0}).to_list(None)
+    }
+
+    operations = []
+    for document in documents:
+        existing = stored.get(document["id"])
+        if existing is None:
+            result.inserted += 1
+        elif _comparable(existing) == _comparable(document):
+            result.unchanged += 1
+            continue
+        else:
+            # Keep the original creation time on documents that are only being revised
+            if "created_at" in existing:
+                document = {**document, "created_at": existing["created_at"]}
+            result.updated += 1
+        result.changed_ids.append(document["id"])
+        operations.append(ReplaceOne({"id": document["id"]}, document, upsert=True))
+
+    seeded_ids = {document["id"] for document in documents}
+    deleted_ids = set(stored) - seeded_ids
+    result.deleted = len(deleted_ids)
+    result.changed_ids.extend(sorted(deleted_ids))
+    if result.deleted:
+        operations.append(DeleteMany({"id": {"$nin": list(seeded_ids)}}))
+
+    if operations:
+        await db[name].bulk_write(operations, ordered=False)
+    return result
@@ -0,0 +1,132 @@
+"""
+Term Resolver
+Resolves a user's phrasing of a glossary term ("c corporation", "REPS",
+"bonus depr", "cost segergation") to a single glossary document in memory.
+Candidates come from in-memory indexes rather than a scan, and are scored
+strongest match kind first: exact name, alias (the "Full Name (ABBR)"
+parts plus the known name variations shared with the duplicate cleanup
+script), prefix (a PrefixIndex over names, aliases and word suffixes), tag,
+text (every query token found in the term's fields, definition included,
+scored by GlossarySearchIndex) and finally bounded edit distance through a
+FuzzyIndex, which never edits digits ("1031" is not a typo of "1040").
+Ties go to the shorter, then alphabetically first, term name so the answer
+is deterministic.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from fuzzy_index import FuzzyIndex
+from glossary_search import GlossarySearchIndex
+from keyword_matcher import normalize, term_aliases
+from prefix_index import PrefixIndex
+
+# Spellings of the same term that the glossary has carried as separate entries
+TERM_NAME_VARIATIONS = {
+    'real estate professional status (reps)': 'reps',
+    'reps (real estate professional status)': 'reps',
+    'qualified opportunity fund (qof)': 'qof',
+    'qof (qualified opportunity fund)': 'qof',
+    'qualified small business stock (qsbs)': 'qsbs',
+    'qsbs (qualified small business stock)': 'qsbs',
+    'section 1202 (qsbs)': 'qsbs',
+    'c-corp (c corporation)': 'c-corp',
+    'c corporation': 'c-corp',
+    's-corp (s corporation)': 's-corp',
+    's corporation': 's-corp',
+    'mso (management services organization)': 'mso',
+    'management services organization': 'mso',
+    'installment sale (section 453)': 'installment sale',
+    'advanced depreciation (bonus depreciation & section 179)': 'bonus depreciation',
+    'bonus depreciation': 'bonus depreciation',
+    'deferred sales trust (dst)': 'deferred sales trust',
+    'tax-free reorganization (f-reorg)': 'f-reorganization',
+    'qualified intermediary (qi)': 'qualified intermediary'
+}
+
+# Match kinds, strongest first
+EXACT, ALIAS, PREFIX, TAG, TEXT, FUZZY = 5, 4, 3, 2, 1, 0
+
+
+def normalize_term_name(term_name: str) -> str:
+    """Lowercased term name, collapsed onto its canonical spelling when it is a known variation."""
+    normalized = term_name.strip().lower()
+    return TERM_NAME_VARIATIONS.get(normalized, normalized)
+
+
+_CANONICAL = {normalize(name): normalize(canonical) for name, canonical in TERM_NAME_VARIATIONS.items()}
+
+
+def canonical_key(text: str) -> str:
+    key = normalize(text)
+    return _CANONICAL.get(key, key)
+
+
+class TermResolver:
+    """Scores glossary documents against a query without touching the database"""
+
+    def __init__(self, terms: Iterable[dict]):
+        self._terms: List[dict] = [term for term in terms if term.get("term")]
+        self._names: List[str] = [normalize(term["term"]) for term in self._terms]
+        self._exact: Dict[str, Set[int]] = {}
+        self._aliases: Dict[str, Set[int]] = {}
+        self._by_tag: Dict[str, Set[int]] = {}
+        self._fuzzy = FuzzyIndex()
+        prefix_entries: Set[Tuple[str, Tuple[bool, int]]] = set()  # (key, (is the whole name, term index))
+        for i, (term, name) in enumerate(zip(self._terms, self._names)):
+            self._exact.setdefault(name, set()).add(i)
+            aliases = {normalize(alias) for alias in term_aliases(term["term"])}
+            aliases |= {canonical_key(alias) for alias in aliases}
+            aliases.discard("")
+            for alias in aliases:
+                self._aliases.setdefault(alias, set()).add(i)
+                self._fuzzy.add(alias, i)
+                prefix_entries.add((alias, (alias == name, i)))
+            words = name.split(" ")
+            for start in range(1, len(words)):
+                prefix_entries.add((" ".join(words[start:]), (False, i)))
+            for tag in term.get("tags") or ():
+                self._by_tag.setdefault(normalize(str(tag)), set()).add(i)
+        self._prefixes = PrefixIndex(prefix_entries)
+        self._text = GlossarySearchIndex()
+        self._text.build({**term, "id": str(i)} for i, term in enumerate(self._terms))
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def rank(self, query: str, limit: int = 5, max_distance: Optional[int] = None) -> List[dict]:
+        """Glossary documents matching query, best match first; max_distance bounds the fuzzy tier."""
+        query_key = normalize(query)
+        if not query_key:
+            return []
+
+        scores: Dict[int, Tuple[int, float]] = {}
+
+        def offer(i: int, kind: int, strength: float):
+            if scores.get(i, (-1, 0.0)) < (kind, strength):
+                scores[i] = (kind, strength)
+
+        for i in self._exact.get(query_key, ()):
+            offer(i, EXACT, 1.0)
+        for i in self._aliases.get(canonical_key(query_key), ()):
+            offer(i, ALIAS, 1.0)
+        for _, (whole, i) in self._prefixes.matches(query_key):
+            # Whole-name prefixes beat word and alias prefixes; among either, the closest length wins
+            offer(i, PREFIX, (1.0 if whole else 0.5) + len(query_key) / len(self._names[i]))
+        for i in self._by_tag.get(query_key, ()):
+            offer(i, TAG, 1.0)
+        text_scores = self._text.token_scores(query_key)
+        top_text_score = max(text_scores.values(), default=0.0)
+        for i, score in text_scores.items():
+            offer(int(i), TEXT, score / top_text_score)
+        for distance, key, indexes in self._fuzzy.search(query_key, max_distance, limit=max(limit, 10)):
+            for i in indexes:
+                offer(i, FUZZY, 1.0 - distance / max(len(query_key), len(key)))
+
+        ranked = heapq.nsmallest(limit, scores, key=lambda i: (-scores[i][0], -scores[i][1], len(self._names[i]), self._names[i]))
+        return [self._terms[i] for i in ranked]
+
+    def resolve(self, query: str) -> Optional[dict]:
+        """The single best glossary document for query, or None."""
+        ranked = self.rank(query, limit=1)
+        return ranked[0] if ranked else None
@@ -0,0 +1,31 @@
+"""
+User Context
+Everything a chat turn reads about its user, fetched in one concurrent round
+with asyncio.gather: the user's entitlement and whether the thread being
+written to belongs to them. The entitlement comes from EntitlementService,
+which already caches it per user with a TTL and drops it on subscription
+writes, so warm turns only wait on the thread lookup. Lesson progress and XP
+are not loaded because no chat response depends on them.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from entitlements import Entitlement, EntitlementService
+
+THREAD_OWNER_PROJECTION = {"_id": 1}
+
+
+@dataclass(frozen=True)
+class ChatTurnContext:
+    entitlement: Entitlement
+    owns_thread: bool
+
+
+async def load_chat_turn_context(db, entitlements: EntitlementService, user_id: str, thread_id: str) -> ChatTurnContext:
+    """Read the user's entitlement and thread ownership concurrently."""
+    entitlement, thread = await asyncio.gather(
+        entitlements.get(user_id),
+        db.chat_threads.find_one({"id": thread_id, "user_id": user_id}, THREAD_OWNER_PROJECTION),
+    )
+    return ChatTurnContext(entitlement, thread is not None)
@@ -0,0 +1,311 @@
+"""
+XP Event Buffer
+Write-behind queue for XP awards. Awards are coalesced per user in memory
+and flushed to `user_xp` through one unordered bulk_write, either on a
+short interval or as soon as enough events have accumulated.
+collapse_duplicate_user_xp merges the per-user duplicates that older
+upserts left behind so the unique user_id index can be built.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from glossary_bitset import (
+    BITS_FIELD, GlossaryOrdinals, count_viewed, decode_bits, encode_bits, mark_viewed_update, unviewed_filter
+)
+
+logger = logging.getLogger(__name__)
+
+GLOSSARY_TERM_XP = 10
+DUPLICATE_KEY_ERROR = 11000
+
+
+@dataclass
+class PendingXP:
+    glossary_ordinals: List[int] = field(default_factory=list)
+    quiz_xp: int = 0
+
+    @property
+    def glossary_xp(self) -> int:
+        return len(self.glossary_ordinals) * GLOSSARY_TERM_XP
+
+    @property
+    def total_xp(self) -> int:
+        return self.glossary_xp + self.quiz_xp
+
+    @property
+    def event_count(self) -> int:
+        return len(self.glossary_ordinals) + (1 if self.quiz_xp else 0)
+
+
+@dataclass
+class XPSnapshot:
+    """Last known persisted XP state for a user"""
+    total_xp: int
+    viewed_bits: int
+    loaded_at: float
+
+
+class XPEventBuffer:
+    """Coalesces XP awards per user and writes them behind with bulk_write"""
+
+    def __init__(self, collection, ordinals: GlossaryOrdinals, flush_interval: float = 0.5,
+                 max_pending: int = 500, snapshot_ttl: float = 60.0, max_snapshots: int = 10000):
+        self.collection = collection
+        self.ordinals = ordinals
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.snapshot_ttl = snapshot_ttl
+        self.max_snapshots = max_snapshots
+        self._pending: Dict[str, PendingXP] = {}
+        self._inflight: Dict[str, PendingXP] = {}
+        self._pending_events = 0
+        self._snapshots: "OrderedDict[str, XPSnapshot]" = OrderedDict()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background flusher and write out everything still queued."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def reset(self):
+        """Forget queued awards and cached snapshots (used when user_xp is wiped)."""
+        # Waiting out a running flush keeps its batch from landing in the wiped collection afterwards
+        async with self._flush_lock:
+            self._pending.clear()
+            self._inflight = {}
+            self._pending_events = 0
+            self._snapshots.clear()
+
+    async def _sync_ordinals(self):
+        """Forget bits and queued views numbered under ordinals that a reseed elsewhere has replaced."""
+        if not await self.ordinals.refresh():
+            return
+        self._snapshots.clear()
+        for user_id, pending in list(self._pending.items()):
+            pending.glossary_ordinals = []
+            if not pending.quiz_xp:
+                del self._pending[user_id]
+        self._pending_events = sum(p.event_count for p in self._pending.values())
+
+    async def award_glossary(self, user_id: str, term_id: str) -> Tuple[bool, int]:
+        """Queue a first-view glossary award; returns (awarded, total_xp)."""
+        await self._sync_ordinals()
+        ordinal = await self.ordinals.ordinal(term_id)
+        snapshot = await self._snapshot(user_id)
+        if snapshot.viewed_bits >> ordinal & 1 or any(ordinal in p.glossary_ordinals for p in self._buffered(user_id)):
+            return False, self.total_xp(user_id)
+
+        self._pending.setdefault(user_id, PendingXP()).glossary_ordinals.append(ordinal)
+        self._queued()
+        return True, self.total_xp(user_id)
+
+    async def award_quiz(self, user_id: str, points: int) -> int:
+        """Queue a quiz award; returns the user's total XP including it."""
+        await self._sync_ordinals()
+        await self._snapshot(user_id)
+        self._pending.setdefault(user_id, PendingXP()).quiz_xp += points
+        self._queued()
+        return self.total_xp(user_id)
+
+    async def current_total(self, user_id: str) -> int:
+        """Total XP including queued awards, loading the stored total if it is not cached."""
+        await self._sync_ordinals()
+        await self._snapshot(user_id)
+        return self.total_xp(user_id)
+
+    def total_xp(self, user_id: str) -> int:
+        snapshot = self._snapshots.get(user_id)
+        stored = snapshot.total_xp if snapshot else 0
+        return stored + sum(p.total_xp for p in self._buffered(user_id))
+
+    async def read(self, user_id: str, default: dict) -> dict:
+        """The user's user_xp document with queued awards applied, storing default if there is none."""
+        await self._sync_ordinals()
+        # An in-flight batch may or may not be in a document read mid-flush, so read between flushes
+        async with self._flush_lock:
+            user_xp = await self.collection.find_one({"user_id": user_id}, {"_id": 0})
+            if user_xp is None:
+                await self.collection.update_one({"user_id": user_id}, {"$setOnInsert": default}, upsert=True)
+                user_xp = dict(default)
+            return self.merge(user_xp)
+
+    def merge(self, user_xp: dict) -> dict:
+        """Apply queued awards to a user_xp document read while no flush was running."""
+        viewed_bits = decode_bits(user_xp.get(BITS_FIELD))
+        pending = self._pending.get(user_xp["user_id"])
+        if pending:
+            new_ordinals = [o for o in pending.glossary_ordinals if not viewed_bits >> o & 1]
+            for ordinal in new_ordinals:
+                viewed_bits |= 1 << ordinal
+            glossary_xp = len(new_ordinals) * GLOSSARY_TERM_XP
+            user_xp["glossary_xp"] = user_xp.get("glossary_xp", 0) + glossary_xp
+            user_xp["quiz_xp"] = user_xp.get("quiz_xp", 0) + pending.quiz_xp
+            user_xp["total_xp"] = user_xp.get("total_xp", 0) + glossary_xp + pending.quiz_xp
+        user_xp[BITS_FIELD] = encode_bits(viewed_bits)
+        return user_xp
+
+    async def flush(self):
+        """Write all queued awards in a single bulk_write."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            self._inflight, self._pending = self._pending, {}
+            self._pending_events = 0
+            self._flush_requested.clear()
+            batch = self._inflight
+            started_at = time.monotonic()
+
+            try:
+                await self.collection.bulk_write(self._build_operations(batch), ordered=False)
+            except BulkWriteError as e:
+                # Duplicate keys mean a guarded glossary award lost to an earlier view; anything else is lost
+                errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != DUPLICATE_KEY_ERROR]
+                if errors:
+                    logger.error(f"XP flush dropped {len(errors)} writes: {errors[0].get('errmsg')}")
+            except PyMongoError as e:
+                logger.error(f"XP flush failed, requeueing {len(batch)} users: {e}")
+                for user_id, pending in batch.items():
+                    self._requeue(user_id, pending)
+                self._inflight = {}
+                return
+
+            self._inflight = {}
+            for user_id, pending in batch.items():
+                snapshot = self._snapshots.get(user_id)
+                if snapshot and snapshot.loaded_at < started_at:
+                    snapshot.total_xp += pending.total_xp
+                    for ordinal in pending.glossary_ordinals:
+                        snapshot.viewed_bits |= 1 << ordinal
+
+    def _build_operations(self, batch: Dict[str, PendingXP]) -> List[UpdateOne]:
+        now = datetime.utcnow()
+        operations = []
+        for user_id, pending in batch.items():
+            for ordinal in pending.glossary_ordinals:
+                operations.append(UpdateOne(
+                    {"user_id": user_id, **unviewed_filter(ordinal)},
+                    {
+                        "$inc": {"glossary_xp": GLOSSARY_TERM_XP, "total_xp": GLOSSARY_TERM_XP},
+                        "$bit": mark_viewed_update([ordinal]),
+                        "$set": {"last_updated": now},
+                        "$setOnInsert": {"id": str(uuid.uuid4()), "quiz_xp": 0, "created_at": now}
+                    },
+                    upsert=True
+                ))
+            if pending.quiz_xp:
+                operations.append(UpdateOne(
+                    {"user_id": user_id},
+                    {
+                        "$inc": {"quiz_xp": pending.quiz_xp, "total_xp": pending.quiz_xp},
+                        "$set": {"last_updated": now},
+                        "$setOnInsert": {"id": str(uuid.uuid4()), "glossary_xp": 0, BITS_FIELD: {}, "created_at": now}
+                    },
+                    upsert=True
+                ))
+        return operations
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def _fresh_snapshot(self, user_id: str) -> Optional[XPSnapshot]:
+        snapshot = self._snapshots.get(user_id)
+        if snapshot is None or time.monotonic() - snapshot.loaded_at > self.snapshot_ttl:
+            return None
+        self._snapshots.move_to_end(user_id)
+        return snapshot
+
+    async def _snapshot(self, user_id: str) -> XPSnapshot:
+        snapshot = self._fresh_snapshot(user_id)
+        if snapshot is not None:
+            return snapshot
+        # Loaded between flushes, so in-flight awards are either all stored or all still buffered
+        async with self._flush_lock:
+            snapshot = self._fresh_snapshot(user_id)
+            if snapshot is not None:
+                return snapshot
+            stored = await self.collection.find_one(
+                {"user_id": user_id}, {"_id": 0, "total_xp": 1, BITS_FIELD: 1}
+            ) or {}
+            snapshot = XPSnapshot(
+                total_xp=stored.get("total_xp", 0),
+                viewed_bits=decode_bits(stored.get(BITS_FIELD)),
+                loaded_at=time.monotonic()
+            )
+            self._snapshots[user_id] = snapshot
+            if len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+            return snapshot
+
+    def _buffered(self, user_id: str) -> List[PendingXP]:
+        return [batch[user_id] for batch in (self._inflight, self._pending) if user_id in batch]
+
+    def _requeue(self, user_id: str, pending: PendingXP):
+        queued = self._pending.setdefault(user_id, PendingXP())
+        queued.glossary_ordinals = pending.glossary_ordinals + queued.glossary_ordinals
+        queued.quiz_xp += pending.quiz_xp
+        self._pending_events += pending.event_count
+
+    def _queued(self):
+        self._pending_events += 1
+        if self._pending_events >= self.max_pending:
+            self._flush_requested.set()
+
+
+async def collapse_duplicate_user_xp(db) -> int:
+    """Merge duplicate user_xp documents per user and drop a non-unique user_id index; returns documents removed."""
+    removed = 0
+    duplicates = db.user_xp.aggregate([
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$user_id", "docs": {"$push": "$$ROOT"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    async for group in duplicates:
+        keep, *extra = group["docs"]
+        # Quiz awards landed on whichever document matched; a term viewed in two documents counts once
+        viewed_bits = 0
+        legacy_terms = set()
+        for doc in group["docs"]:
+            viewed_bits |= decode_bits(doc.get(BITS_FIELD))
+            legacy_terms.update(doc.get("viewed_glossary_terms") or ())
+        words = encode_bits(viewed_bits)
+        quiz_xp = sum(doc.get("quiz_xp", 0) for doc in group["docs"])
+        glossary_xp = (count_viewed(words) + len(legacy_terms)) * GLOSSARY_TERM_XP
+        update = {"$set": {BITS_FIELD: words, "quiz_xp": quiz_xp, "glossary_xp": glossary_xp, "total_xp": quiz_xp + glossary_xp}}
+        if legacy_terms:
+            update["$set"]["viewed_glossary_terms"] = sorted(legacy_terms)
+        await db.user_xp.update_one({"_id": keep["_id"]}, update)
+        result = await db.user_xp.delete_many({"_id": {"$in": [doc["_id"] for doc in extra]}})
+        removed += result.deleted_count
+
+    # An index on user_id built before it was unique has to go so the unique one can replace it
+    for name, info in (await db.user_xp.index_information()).items():
+        if tuple(k for k, _ in info["key"]) == ("user_id",) and not info.get("unique"):
+            await db.user_xp.drop_index(name)
+            logger.info(f"Dropped non-unique user_xp index {name}")
+    return removed
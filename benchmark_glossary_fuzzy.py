@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Glossary Fuzzy Lookup Benchmark
+
+Measures typo-tolerant glossary lookups as the glossary grows. The seed
+glossary from backend/content_pack/ is padded with synthetic terms up to
+each size, then queried with misspelled term names (one transposition,
+substitution, insertion or deletion each). Reports index build time and
+median / p99 latency for the raw FuzzyIndex, /api/glossary/search's
+GlossarySearchIndex fallback and Quinn's TermResolver, plus how many typo
+queries found the term they were misspelling (or a duplicate of it that
+shares an alias).
+
+Synthetic terms combine 2-4 words from a vocabulary that grows with the
+glossary (about one new made-up word per four terms), as real glossaries'
+vocabularies do. --fixed-vocabulary builds every term from the same ~100
+tax words instead, a worst case where every word is shared by thousands
+of terms.
+
+Usage: python benchmark_glossary_fuzzy.py [--sizes N ...] [--queries N] [--seed S] [--fixed-vocabulary]
+"""
+
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+from content_pack import load_content_pack  # noqa: E402
+from fuzzy_index import FuzzyIndex  # noqa: E402
+from glossary_search import GlossarySearchIndex  # noqa: E402
+from keyword_matcher import normalize, term_aliases  # noqa: E402
+from term_resolver import TermResolver  # noqa: E402
+
+WORDS = """
+accelerated accrual adjusted allocation amortization annuity asset basis benefit bonus capital carryforward
+charitable compensation conversion corporate cost credit deduction deferred defined depletion depreciation
+dividend donor election employee energy entity equity estate exchange exclusion family foreign gain gift
+grantor holding income installment intangible interest investment lease liability like-kind loss management
+marital nonqualified offset opportunity ordinary partnership passive pension personal property qualified
+rebate recapture rental residential retirement revocable roth royalty sale section segregation services
+shelter small stock structure surplus tax trust unrelated valuation vesting withholding
+""".split()
+
+
+SYLLABLES = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"] + ["ar", "en", "il", "on", "us", "ex", "al"]
+
+
+def vocabulary(size: int, rng: random.Random, fixed: bool) -> list:
+    words = set(WORDS)
+    while not fixed and len(words) < len(WORDS) + size // 4:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def synthetic_terms(count: int, rng: random.Random, taken: set, words: list = WORDS) -> list:
+    terms = []
+    while len(terms) < count:
+        name = " ".join(rng.sample(words, rng.randint(2, 4))).title()
+        if rng.random() < 0.2:
+            name += f" ({''.join(word[0] for word in name.split()).upper()})"
+        if normalize(name) in taken:
+            continue
+        taken.add(normalize(name))
+        terms.append({"id": f"synthetic-{len(terms)}", "term": name, "definition": f"{name} definition", "tags": []})
+    return terms
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word) - 1)
+    edit = rng.choice(("transpose", "substitute", "insert", "delete"))
+    if edit == "transpose":
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    if edit == "substitute":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+    if edit == "insert":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    return word[:i] + word[i + 1:]
+
+
+def timed(fn, queries) -> dict:
+    samples, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(fn(query))
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "median_us": statistics.median(samples) * 1e6,
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='*', default=[60, 1000, 10000, 50000])
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--fixed-vocabulary', action='store_true')
+    args = parser.parse_args()
+
+    seed_terms = [term for term in load_content_pack()["glossary"] if term.get("term")]
+    print(f"{'terms':>7}  {'lookup':<20}{'build (ms)':>12}{'median (us)':>13}{'p99 (us)':>11}{'found':>8}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        glossary = seed_terms[:size]
+        words = vocabulary(size, rng, args.fixed_vocabulary)
+        glossary += synthetic_terms(size - len(glossary), rng, {normalize(term["term"]) for term in glossary}, words)
+        aliases = {term["id"]: {normalize(alias) for alias in term_aliases(term["term"])} for term in glossary}
+
+        targets = [rng.choice(glossary) for _ in range(args.queries)]
+        queries = []
+        for term in targets:
+            alias = normalize(rng.choice(term_aliases(term["term"])))
+            queries.append(misspell(alias, rng) if len(alias) > 3 else alias)
+
+        start = time.perf_counter()
+        fuzzy = FuzzyIndex((alias, term["id"]) for term in glossary for alias in term_aliases(term["term"]))
+        fuzzy_build = time.perf_counter() - start
+        start = time.perf_counter()
+        search_index = GlossarySearchIndex()
+        search_index.build(glossary)
+        search_build = time.perf_counter() - start
+        start = time.perf_counter()
+        resolver = TermResolver(glossary)
+        resolver_build = time.perf_counter() - start
+
+        lookups = [
+            ("FuzzyIndex.search", fuzzy_build, lambda q: [tid for _, _, ids in fuzzy.search(q) for tid in ids]),
+            ("glossary search", search_build, lambda q: [term["id"] for term in search_index.search(q, limit=10)]),
+            ("TermResolver.resolve", resolver_build, lambda q: [(resolver.resolve(q) or {}).get("id")]),
+        ]
+        for name, build, lookup in lookups:
+            r = timed(lookup, queries)
+            found = sum(
+                any(aliases[term["id"]] & aliases.get(tid, set()) for tid in ids)
+                for term, ids in zip(targets, r["results"])
+            ) / len(targets)
+            print(f"{size:>7}  {name:<20}{build * 1000:>12.1f}{r['median_us']:>13.1f}{r['p99_us']:>11.1f}{found:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Server Import Benchmark
+
+Measures cold-start import time and resident memory of backend server
+modules in fresh interpreters. With --baseline the same modules are also
+measured as of an earlier git revision, e.g. to compare server.py before
+and after the seed content moved into backend/content_pack/.
+
+Usage: python benchmark_server_import.py [--runs N] [--baseline REF] [module ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent / 'backend'
+
+# Dependencies are imported before the clock starts so only the module itself is measured
+PROBE = """
+import json, resource, sys, time
+import fastapi, fastapi.encoders, motor.motor_asyncio, pydantic, dotenv, pymongo, starlette.responses
+try:
+    import brotli
+except ImportError:
+    pass
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_kb": rss_after, "rss_delta_kb": rss_after - rss_before}))
+"""
+
+
+def measure(module: str, cold: bool, backend_dir: Path = BACKEND_DIR) -> dict:
+    env = dict(os.environ)
+    env.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+    env.setdefault('DB_NAME', 'import_benchmark')
+    args = [sys.executable]
+    if cold:
+        # -B with a throwaway pycache prefix forces the module to be compiled from source
+        env['PYTHONPYCACHEPREFIX'] = str(Path('/tmp') / f'import_benchmark_{os.getpid()}')
+        args.append('-B')
+    result = subprocess.run(args + ['-c', PROBE, module], cwd=backend_dir, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(module: str, runs: int, cold: bool, backend_dir: Path) -> dict:
+    samples = [measure(module, cold, backend_dir) for _ in range(runs)]
+    return {
+        "median_ms": statistics.median(s["seconds"] for s in samples) * 1000,
+        "rss_mb": statistics.median(s["rss_kb"] for s in samples) / 1024,
+        "rss_delta_mb": statistics.median(s["rss_delta_kb"] for s in samples) / 1024,
+    }
+
+
+def checkout_backend(ref: str, into: Path) -> Path:
+    """Extract backend/ as of a git revision into a scratch directory."""
+    archive = subprocess.run(['git', 'archive', ref, 'backend'], cwd=Path(__file__).parent,
+                             capture_output=True, check=True).stdout
+    subprocess.run(['tar', '-x', '-C', str(into)], input=archive, check=True)
+    return into / 'backend'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=['server'])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--baseline', help='git revision to compare the working tree against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        trees = [('worktree', BACKEND_DIR)]
+        if args.baseline:
+            trees.insert(0, (args.baseline, checkout_backend(args.baseline, Path(scratch))))
+
+        print(f"{'module':<24}{'mode':<7}{'import (ms)':>14}{'max RSS (MB)':>15}{'RSS added (MB)':>17}")
+        for label, backend_dir in trees:
+            for module in args.modules:
+                # Warm the bytecode cache once so the "warm" rows reflect a normal worker start
+                measure(module, cold=False, backend_dir=backend_dir)
+                for mode in ('cold', 'warm'):
+                    r = benchmark(module, args.runs, cold=(mode == 'cold'), backend_dir=backend_dir)
+                    name = f"{module}@{label}"
+                    print(f"{name:<24}{mode:<7}{r['median_ms']:>14.1f}{r['rss_mb']:>15.1f}{r['rss_delta_mb']:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Deletes the specific "C-Corp MSO" duplicate term while preserving
 
 import asyncio
 import os
+import sys
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 from pathlib import Path
@@ -14,6 +15,9 @@ from pathlib import Path
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
+from glossary_mentions import rebuild_mentions  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
@@ -201,6 +205,8 @@ async def main():
         import traceback
         traceback.print_exc()
     finally:
+        await bump_catalog_version(db, "glossary")
+        await rebuild_mentions(db)
         client.close()
 
 if __name__ == "__main__":
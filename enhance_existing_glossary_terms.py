@@ -9,6 +9,7 @@ have complete enhanced formatting.
 
 import asyncio
 import os
+import sys
 import uuid
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -18,6 +19,8 @@ from pathlib import Path
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
@@ -236,6 +239,7 @@ async def main():
         import traceback
         traceback.print_exc()
     finally:
+        await bump_catalog_version(db, "glossary")
         client.close()
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ Enhances the next 10 glossary terms (11-20) with comprehensive content including
 
 import asyncio
 import os
+import sys
 import uuid
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -19,6 +20,8 @@ from pathlib import Path
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
@@ -237,6 +240,7 @@ async def main():
     except Exception as e:
         print(f"❌ Error during enhancement: {e}")
     finally:
+        await bump_catalog_version(db, "glossary")
         client.close()
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ This script will:
 
 import asyncio
 import os
+import sys
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 from pathlib import Path
@@ -18,6 +19,9 @@ from pathlib import Path
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
+from glossary_mentions import reindex_course  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
@@ -142,6 +146,9 @@ async def main():
         import traceback
         traceback.print_exc()
     finally:
+        await bump_catalog_version(db, "courses")
+        async for course in db.courses.find({"type": "w2"}, {"_id": 0, "id": 1}):
+            await reindex_course(db, course["id"])
         client.close()
 
 if __name__ == "__main__":
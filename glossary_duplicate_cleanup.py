@@ -7,6 +7,7 @@ and maintaining database integrity.
 
 import asyncio
 import os
+import sys
 from collections import defaultdict
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
@@ -15,6 +16,10 @@ from pathlib import Path
 # Load environment variables
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
+from glossary_mentions import rebuild_mentions  # noqa: E402
+from term_resolver import normalize_term_name  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
@@ -44,36 +49,6 @@ def calculate_completeness_score(term):
     
     return score
 
-def normalize_term_name(term_name):
-    """Normalize term names for comparison."""
-    # Remove common variations and extra spaces
-    normalized = term_name.strip().lower()
-    
-    # Handle common variations
-    variations = {
-        'real estate professional status (reps)': 'reps',
-        'reps (real estate professional status)': 'reps',
-        'qualified opportunity fund (qof)': 'qof',
-        'qof (qualified opportunity fund)': 'qof',
-        'qualified small business stock (qsbs)': 'qsbs',
-        'qsbs (qualified small business stock)': 'qsbs',
-        'section 1202 (qsbs)': 'qsbs',
-        'c-corp (c corporation)': 'c-corp',
-        'c corporation': 'c-corp',
-        's-corp (s corporation)': 's-corp',
-        's corporation': 's-corp',
-        'mso (management services organization)': 'mso',
-        'management services organization': 'mso',
-        'installment sale (section 453)': 'installment sale',
-        'advanced depreciation (bonus depreciation & section 179)': 'bonus depreciation',
-        'bonus depreciation': 'bonus depreciation',
-        'deferred sales trust (dst)': 'deferred sales trust',
-        'tax-free reorganization (f-reorg)': 'f-reorganization',
-        'qualified intermediary (qi)': 'qualified intermediary'
-    }
-    
-    return variations.get(normalized, normalized)
-
 async def find_duplicates():
     """Find all duplicate terms in the glossary."""
     print("🔍 Scanning for duplicate glossary terms...")
@@ -265,6 +240,8 @@ async def main():
         import traceback
         traceback.print_exc()
     finally:
+        await bump_catalog_version(db, "glossary")
+        await rebuild_mentions(db)
         client.close()
 
 if __name__ == "__main__":
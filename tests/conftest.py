@@ -0,0 +1,41 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / 'backend'
+sys.path.insert(0, str(BACKEND_DIR))
+
+# server.py and the scripts read these at import time; tests never open a connection
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'test_database')
+os.environ.setdefault('QUIZ_SESSION_SECRET', 'test-quiz-session-secret')
+
+
+class FakeQuizSessionUses:
+    """In-memory quiz_session_uses with the unique _id that QuizSessionLedger relies on"""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs.setdefault(query["_id"], {"_id": query["_id"], **update["$setOnInsert"]})
+
+    async def insert_one(self, document):
+        from pymongo.errors import DuplicateKeyError
+
+        if document["_id"] in self.docs:
+            raise DuplicateKeyError("E11000 duplicate key error")
+        self.docs[document["_id"]] = document
+
+
+@pytest.fixture
+def quiz_session_uses(monkeypatch):
+    """Point server's quiz session ledger at an in-memory collection"""
+    import server
+    from quiz_session import QuizSessionLedger
+
+    uses = FakeQuizSessionUses()
+    monkeypatch.setattr(server, "quiz_session_ledger", QuizSessionLedger(uses))
+    return uses
@@ -0,0 +1,34 @@
+import gzip
+
+from catalog_cache import accepted_encodings, accepts_encoding, build_payload
+
+
+def test_accepted_encodings_keeps_refusals():
+    assert accepted_encodings("gzip, br;q=0, *;q=0.5") == {"gzip": 1.0, "br": 0.0, "*": 0.5}
+
+
+def test_explicit_refusal_beats_wildcard():
+    accepted = accepted_encodings("*, br;q=0")
+    assert not accepts_encoding(accepted, "br")
+    assert accepts_encoding(accepted, "gzip")
+
+
+def test_wildcard_refusal_only_covers_unlisted_codings():
+    accepted = accepted_encodings("gzip, *;q=0")
+    assert accepts_encoding(accepted, "gzip")
+    assert not accepts_encoding(accepted, "br")
+
+
+def test_response_skips_refused_brotli():
+    payload = build_payload(1, {"hello": "world"}, compress=True)
+    payload.encoded["br"] = b"brotli body"  # Present even when the brotli package is not installed
+
+    response = payload.to_response(None, "*, br;q=0")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(response.body) == payload.body
+
+
+def test_matching_etag_returns_not_modified():
+    payload = build_payload(3, [1, 2, 3])
+    assert payload.to_response(payload.etag).status_code == 304
+    assert payload.to_response('"other"').status_code == 200
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from pymongo import ASCENDING
+from pymongo.errors import OperationFailure
+
+from db_indexes import REQUIRED_INDEXES, IndexProvisioningError, _index, ensure_indexes, find_collection_scans, provision_indexes
+
+
+class FakeCursor:
+    def __init__(self, plan):
+        self.plan = plan
+
+    def sort(self, sort):
+        return self
+
+    async def explain(self):
+        if isinstance(self.plan, Exception):
+            raise self.plan
+        return {"queryPlanner": {"winningPlan": self.plan}}
+
+
+class FakeCollection:
+    def __init__(self, plan=None, duplicates=False):
+        self.plan = plan or {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}
+        self.duplicates = duplicates
+
+    async def index_information(self):
+        return {"_id_": {"key": [("_id", 1)]}}
+
+    async def create_indexes(self, models):
+        if self.duplicates and models[0].document.get("unique"):
+            raise OperationFailure("E11000 duplicate key error")
+
+    def find(self, query):
+        return FakeCursor(self.plan)
+
+
+def test_explain_failures_are_skipped():
+    db = {
+        "chat_messages": FakeCollection(OperationFailure("text index required for $text query")),
+        "courses": FakeCollection({"stage": "COLLSCAN"}),
+    }
+    queries = [
+        ("chat_messages", {"$text": {"$search": "refund"}}, None),
+        ("courses", {"id": ""}, None),
+    ]
+    assert asyncio.run(find_collection_scans(db, queries)) == ["courses {'id': ''}"]
+
+
+def test_unique_index_failure_is_reported():
+    db = {"user_xp": FakeCollection(duplicates=True), "tools": FakeCollection(duplicates=True)}
+    required = {
+        "user_xp": [_index(("user_id", ASCENDING), unique=True)],
+        "tools": [_index(("category", ASCENDING))],
+    }
+    report = asyncio.run(ensure_indexes(db, required))
+    assert report.failed_unique == ["user_xp.user_id_1"]
+    assert report.created == ["tools.category_1"]
+
+
+def test_provisioning_fails_without_required_unique_index():
+    db = {name: FakeCollection(duplicates=name == "user_xp") for name in REQUIRED_INDEXES}
+    with pytest.raises(IndexProvisioningError, match="user_xp.user_id_1"):
+        asyncio.run(provision_indexes(db))
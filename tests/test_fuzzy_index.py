@@ -0,0 +1,83 @@
+import pytest
+
+from fuzzy_index import FuzzyIndex, _Vocabulary, bounded_distance, deletions
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("segregation", "segregation", 0),
+    ("segergation", "segregation", 1),  # adjacent transposition counts once
+    ("depreciaton", "depreciation", 1),
+    ("bonus", "bomus", 1),
+    ("reps", "rep", 1),
+    ("qsbs", "qbss", 1),
+    ("cost", "cots", 1),
+    ("trust", "tryst", 1),
+    ("ab", "ba", 1),
+    ("kitten", "sitting", 3),
+    ("", "abc", 3),
+])
+def test_bounded_distance_matches_osa_distance(a, b, expected):
+    assert bounded_distance(a, b, 3) == expected
+    assert bounded_distance(b, a, 3) == expected
+
+
+def test_bounded_distance_gives_up_past_the_bound():
+    assert bounded_distance("kitten", "sitting", 2) is None
+    assert bounded_distance("abc", "abcdef", 2) is None
+    assert bounded_distance("installment", "instalment", 0) is None
+    assert bounded_distance("installment", "instalment", 1) == 1
+
+
+def test_deletions_cover_up_to_the_limit():
+    assert deletions("abc", 1) == {"abc", "bc", "ac", "ab"}
+    assert "a" in deletions("abc", 2)
+    assert deletions("ab", 5) == {"ab", "a", "b", ""}
+
+
+def vocabulary(*words):
+    vocab = _Vocabulary()
+    for word in words:
+        vocab.add(word)
+    return vocab
+
+
+def test_split_separates_run_together_words():
+    vocab = vocabulary("tax", "planning", "entity", "trap")
+    assert vocab.split("taxplanning") == ("tax", "planning")
+    assert vocab.split("entityjtrap") == ("entity", "trap")  # one stray character between
+    assert vocab.split("taxes") is None
+
+
+def test_similar_uses_both_short_and_long_word_paths():
+    vocab = vocabulary("reps", "depreciation", "segregation", "opportunity")
+    assert vocab.similar("rsps", 1) == [(1, "reps")]
+    assert vocab.similar("segergation", 2) == [(1, "segregation")]
+    assert sorted(vocab.similar("oportunty", 2)) == [(2, "opportunity")]
+    assert vocab.similar("zzzz", 2) == []
+
+
+def test_search_finds_typos_and_runs_together():
+    index = FuzzyIndex([
+        ("cost segregation", "cs"), ("bonus depreciation", "bd"), ("tax planning", "tp"), ("reps", "reps"),
+    ])
+    assert index.search("cost segergation")[0][2] == {"cs"}
+    assert index.search("bonus depreciaton")[0][:2] == (1, "bonus depreciation")
+    assert index.search("taxplanning")[0][2] == {"tp"}
+    assert index.search("xyzzy") == []
+    assert index.search("rep", max_distance=0) == []
+
+
+def test_remove_forgets_keys():
+    index = FuzzyIndex([("cost segregation", "cs"), ("cost basis", "cb")])
+    index.remove("cs")
+    assert len(index) == 1
+    assert index.search("cost segregaton") == []
+    assert index.search("cost basys")[0][2] == {"cb"}
+
+
+def test_numbers_are_never_fuzzy_matched():
+    index = FuzzyIndex([("1040", "form"), ("form 1040", "form"), ("section 1031 exchange", "1031")])
+    assert index.search("1031") == []
+    assert index.search("1041") == []
+    assert index.search("form 1099") == []
+    assert index.search("section 1031 exchnge")[0][2] == {"1031"}
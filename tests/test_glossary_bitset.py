@@ -0,0 +1,84 @@
+import asyncio
+
+from bson.int64 import Int64
+
+from glossary_bitset import GlossaryOrdinals, WORD_BITS, count_viewed, decode_bits, encode_bits, mark_viewed_update, unviewed_filter
+
+
+def test_round_trip_across_words():
+    bits = 1 << 0 | 1 << 5 | 1 << 64 | 1 << 200
+    words = encode_bits(bits)
+    assert set(words) == {"0", "1", "3"}
+    assert decode_bits(words) == bits
+    assert count_viewed(words) == 4
+
+
+def test_high_bit_is_stored_as_negative_int64():
+    bits = 1 << (WORD_BITS - 1) | 1
+    words = encode_bits(bits)
+    assert isinstance(words["0"], Int64)
+    assert words["0"] == -(1 << 63) + 1
+    assert decode_bits(words) == bits
+    assert count_viewed(words) == 2
+
+
+def test_all_bits_of_a_word_set():
+    bits = (1 << WORD_BITS) - 1
+    assert encode_bits(bits) == {"0": Int64(-1)}
+    assert decode_bits({"0": -1}) == bits
+    assert count_viewed({"0": -1}) == WORD_BITS
+
+
+def test_empty_bitsets():
+    assert encode_bits(0) == {}
+    assert decode_bits(None) == 0
+    assert count_viewed({}) == 0
+
+
+def test_updates_and_filters_address_the_right_word():
+    assert unviewed_filter(70) == {"viewed_glossary_bits.1": {"$not": {"$bitsAllSet": [6]}}}
+    update = mark_viewed_update([1, 3, 127])
+    assert update == {
+        "viewed_glossary_bits.0": {"or": Int64(0b1010)},
+        "viewed_glossary_bits.1": {"or": Int64(-(1 << 63))},
+    }
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return list(self.docs)
+
+
+class FakeOrdinalsCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self):
+        return FakeCursor(self.docs)
+
+
+def test_ordinals_reload_when_another_process_renumbers_them():
+    stamps = {"glossary_ordinals": 1}
+    stored = [{"_id": "t1", "ordinal": 0}, {"_id": "t2", "ordinal": 1}]
+    db = {"glossary_ordinals": FakeOrdinalsCollection(stored)}
+
+    async def versions():
+        return stamps
+
+    async def scenario():
+        ordinals = GlossaryOrdinals(db, versions)
+        before = await ordinals.ordinal("t2"), await ordinals.term_ids(0b10)
+        stored[:] = [{"_id": "t2", "ordinal": 0}, {"_id": "t1", "ordinal": 1}]
+        unchanged = await ordinals.ordinal("t2")
+        stamps["glossary_ordinals"] = 2
+        stale = await ordinals.refresh()
+        return before, unchanged, stale, await ordinals.ordinal("t2"), await ordinals.term_ids(0b10)
+
+    before, unchanged, stale, after, term_ids = asyncio.run(scenario())
+    assert before == (1, ["t2"])
+    assert unchanged == 1  # Cached until the stamp moves
+    assert stale is True
+    assert (after, term_ids) == (0, ["t1"])
@@ -0,0 +1,44 @@
+from keyword_matcher import KeywordMatcher, normalize, normalize_with_positions, term_aliases
+
+
+def test_keywords_only_match_whole_words():
+    matcher = KeywordMatcher([("str", "str"), ("reps", "reps")])
+    assert matcher.labels("Is STR a good strategy?") == {"str"}
+    assert matcher.labels("strategy and representation") == set()
+    assert matcher.labels("str") == {"str"}
+    assert matcher.labels("(REPS)") == {"reps"}
+
+
+def test_hyphens_and_whitespace_match_alike():
+    matcher = KeywordMatcher([("split-dollar", "sd"), ("cost segregation", "cs")])
+    assert matcher.labels("a split dollar plan") == {"sd"}
+    assert matcher.labels("cost-segregation\n study") == {"cs"}
+    assert matcher.labels("cost   segregation") == {"cs"}
+
+
+def test_overlapping_matches_report_original_offsets():
+    text = "Bonus  Depreciation rules"
+    matcher = KeywordMatcher([("bonus depreciation", "bd"), ("depreciation", "d")])
+    hits = sorted(matcher.matches(text))
+    assert [(text[start:end], label) for start, end, label in hits] == [
+        ("Bonus  Depreciation", "bd"),
+        ("Depreciation", "d"),
+    ]
+
+
+def test_failure_links_find_keywords_inside_longer_partial_matches():
+    matcher = KeywordMatcher([("tax credit", 1), ("credit card", 2), ("bc", 3)])
+    assert matcher.labels("tax credit card") == {1, 2}
+    assert matcher.labels("tax credit cards") == {1}
+    assert matcher.labels("abc d") == set()
+
+
+def test_normalization_helpers():
+    assert normalize("  C-Corp \t Election ") == "c corp election"
+    text, positions = normalize_with_positions(" A - b")
+    assert text == "a b"
+    assert [" A - b"[p] for p in positions] == ["A", " ", "b"]
+    assert term_aliases("Real Estate Professional Status (REPS)") == [
+        "Real Estate Professional Status (REPS)", "Real Estate Professional Status", "REPS"
+    ]
+    assert term_aliases("Depreciation") == ["Depreciation"]
@@ -0,0 +1,17 @@
+import pytest
+
+from entitlements import DEFAULT_ENTITLEMENT, Entitlement
+
+ALL_ACCESS = Entitlement(plan_type="all_access", has_active_subscription=True)
+
+
+@pytest.mark.parametrize("entitlement, locked", [
+    (DEFAULT_ENTITLEMENT, ["Advanced Module 6", "Advanced Module 8"]),
+    (ALL_ACCESS, []),
+])
+def test_premium_topics_are_locked_only_without_full_access(entitlement, locked):
+    import server
+
+    prepared = server.prepare_ai_response("Can QSBS and split-dollar work together?", entitlement)
+    assert prepared["locked_modules"] == locked
+    assert prepared["locked_content"] is not entitlement.has_full_access
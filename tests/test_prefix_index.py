@@ -0,0 +1,50 @@
+from glossary_search import GlossarySearchIndex
+from glossary_suggest import GlossarySuggester
+from prefix_index import PrefixIndex
+
+
+def test_matches_return_the_prefix_slice_in_key_order():
+    index = PrefixIndex([("depreciation", 1), ("deferred", 2), ("bonus", 3), ("dep", 4), ("de", 5)])
+    assert len(index) == 5
+    assert list(index.matches("dep")) == [("dep", 4), ("depreciation", 1)]
+    assert [key for key, _ in index.matches("de")] == ["de", "deferred", "dep", "depreciation"]
+
+
+def test_no_match_and_empty_prefix():
+    index = PrefixIndex([("alpha", 1), ("beta", 2)])
+    assert list(index.matches("gamma")) == []
+    assert list(index.matches("alphabet")) == []
+    assert list(index.matches("")) == [("alpha", 1), ("beta", 2)]
+    assert list(PrefixIndex([]).matches("a")) == []
+
+
+def test_duplicate_keys_keep_every_payload():
+    index = PrefixIndex([("reps", "a"), ("reps", "b")])
+    assert sorted(payload for _, payload in index.matches("rep")) == ["a", "b"]
+
+
+def suggester():
+    index = GlossarySearchIndex()
+    index.build([
+        {"id": "bd", "term": "Bonus Depreciation", "definition": "", "tags": ["depreciation"]},
+        {"id": "reps", "term": "Real Estate Professional Status (REPS)", "definition": "", "tags": []},
+        {"id": "dst", "term": "Deferred Sales Trust", "definition": "", "tags": []},
+    ])
+    return GlossarySuggester(index)
+
+
+def test_suggestions_rank_names_before_later_words_and_dedupe_terms():
+    suggestions = suggester().suggest("de")
+    assert [(s["text"], s["kind"]) for s in suggestions] == [
+        ("Deferred Sales Trust", "term"),
+        ("depreciation", "tag"),
+        ("Bonus Depreciation", "term"),
+    ]
+
+
+def test_suggestions_match_abbreviations_and_respect_the_limit():
+    assert suggester().suggest("REP")[0] == {
+        "text": "REPS", "kind": "alias", "term_id": "reps", "term": "Real Estate Professional Status (REPS)"
+    }
+    assert len(suggester().suggest("d", limit=1)) == 1
+    assert suggester().suggest("   ") == []
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime
+
+from pymongo import ReturnDocument
+
+from progress_store import complete_lesson, save_progress
+
+
+class FakeProgress:
+    """Single-key user_progress supporting the $set / $max / $setOnInsert upserts progress_store issues"""
+
+    def __init__(self):
+        self.doc = None
+
+    async def find_one_and_update(self, key, update, upsert=False, projection=None, return_document=None):
+        before = dict(self.doc) if self.doc else None
+        if self.doc is None:
+            self.doc = {**key, **update.get("$setOnInsert", {})}
+        self.doc.update(update.get("$set", {}))
+        for field, value in update.get("$max", {}).items():
+            if self.doc.get(field) is None or value > self.doc[field]:
+                self.doc[field] = value
+        return before if return_document == ReturnDocument.BEFORE else dict(self.doc)
+
+
+class FakeDB:
+    def __init__(self):
+        self.user_progress = FakeProgress()
+
+
+def progress(**fields):
+    return {"id": "p1", "user_id": "u1", "course_id": "c1", "lesson_id": "l1",
+            "completed": False, "score": None, "completed_at": None, **fields}
+
+
+def test_save_without_score_keeps_the_best_score():
+    db = FakeDB()
+    finished = datetime(2026, 1, 1)
+    asyncio.run(save_progress(db, progress(completed=True, score=80, completed_at=finished)))
+    saved = asyncio.run(save_progress(db, progress(completed=True)))
+    assert saved["score"] == 80
+    assert saved["completed_at"] == finished
+
+
+def test_save_never_lowers_the_score():
+    db = FakeDB()
+    asyncio.run(save_progress(db, progress(score=80)))
+    assert asyncio.run(save_progress(db, progress(score=30)))["score"] == 80
+    assert asyncio.run(save_progress(db, progress(score=95)))["score"] == 95
+
+
+def test_regrade_after_save_earns_nothing_new():
+    db = FakeDB()
+    asyncio.run(save_progress(db, progress(completed=True, score=60)))
+    asyncio.run(save_progress(db, progress(completed=True)))
+    previous = asyncio.run(complete_lesson(db, "u1", "c1", "l1", 60))
+    assert previous == 60
+
+
+def test_save_without_completed_keeps_a_finished_lesson_complete():
+    import server
+
+    db = FakeDB()
+    asyncio.run(save_progress(db, progress(completed=True, score=80)))
+    sent = server.UserProgress(user_id="u1", course_id="c1", lesson_id="l1", score=50)
+    saved = asyncio.run(save_progress(db, sent.dict(exclude_unset=True)))
+    assert saved["completed"] is True
+    assert saved["score"] == 80
+    assert saved["id"] == "p1"
+
+
+def test_explicit_completed_false_is_written():
+    db = FakeDB()
+    asyncio.run(save_progress(db, progress(completed=True)))
+    saved = asyncio.run(save_progress(db, {"user_id": "u1", "course_id": "c1", "lesson_id": "l1", "completed": False}))
+    assert saved["completed"] is False
@@ -0,0 +1,70 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from quiz_bank import QuizBank
+
+QUESTIONS = [
+    {"id": "q1", "question": "Pick B", "type": "multiple_choice", "options": ["A", "B", "C"],
+     "correct_answer": "B", "explanation": "B is right", "points": 10, "course_id": "c1", "module_id": 1},
+    {"id": "q2", "question": "Pick Z", "type": "multiple_choice", "options": ["X", "Y", "Z"],
+     "correct_answer": "Z", "explanation": "Z is right", "points": 20, "course_id": "c1", "module_id": 1},
+]
+
+
+@pytest.fixture
+def client(monkeypatch, quiz_session_uses):
+    import server
+
+    async def get_quiz_bank(course_id, module_id):
+        return QuizBank(QUESTIONS)
+
+    monkeypatch.setattr(server, "get_quiz_bank", get_quiz_bank)
+    return TestClient(server.app)
+
+
+@pytest.mark.parametrize("seed", ["-1", str(2**64), "abc"])
+def test_out_of_range_seeds_are_rejected(client, seed):
+    assert client.get("/api/courses/c1/quiz", params={"module_id": 1, "seed": seed}).status_code == 422
+
+
+def test_seed_replays_the_same_order(client):
+    first = client.get("/api/courses/c1/quiz", params={"module_id": 1, "seed": 2**64 - 1})
+    again = client.get("/api/courses/c1/quiz", params={"module_id": 1, "seed": 2**64 - 1})
+    assert first.status_code == 200
+    assert first.json() == again.json()
+    assert first.headers["X-Quiz-Seed"] == str(2**64 - 1)
+
+
+def start_quiz(client):
+    response = client.get("/api/courses/c1/quiz", params={"module_id": 1})
+    return response.headers["X-Quiz-Session"], response.json()
+
+
+def test_submit_requires_an_answer_before_revealing_anything(client):
+    session, _ = start_quiz(client)
+    response = client.post("/api/quiz/submit", params={"course_id": "c1", "question_id": "q1", "session": session})
+    assert response.status_code == 400
+    assert "correct_answer_index" not in response.json()
+
+
+def test_revealed_session_cannot_be_graded_for_xp(client):
+    session, questions = start_quiz(client)
+    reveal = client.post("/api/quiz/submit", params={
+        "course_id": "c1", "question_id": "q1", "answer_index": 0, "session": session
+    })
+    assert reveal.status_code == 200 and "correct_answer_index" in reveal.json()
+
+    answers = {q["id"]: 0 for q in questions}
+    assert client.post("/api/quiz/submit/batch", params={"course_id": "c1"},
+                       json={"session": session, "answers": answers}).status_code == 409
+    assert client.post("/api/courses/c1/modules/1/quiz/grade",
+                       json={"session": session, "answers": answers}).status_code == 409
+
+
+def test_a_session_is_graded_once(client):
+    session, questions = start_quiz(client)
+    answers = {q["id"]: 0 for q in questions}
+    first = client.post("/api/quiz/submit/batch", params={"course_id": "c1"}, json={"session": session, "answers": answers})
+    assert first.status_code == 200
+    assert client.post("/api/courses/c1/modules/1/quiz/grade",
+                       json={"session": session, "answers": answers}).status_code == 409
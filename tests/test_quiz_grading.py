@@ -0,0 +1,120 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from quiz_bank import QuizBank, lesson_for_module
+
+CONTENT_PACK = Path(__file__).resolve().parent.parent / "backend" / "content_pack"
+COURSES = {course["type"]: course for course in json.loads((CONTENT_PACK / "courses.json").read_text())}
+QUESTIONS = json.loads((CONTENT_PACK / "quiz_questions.json").read_text())
+
+
+def module_lesson_title(course_type, module_id):
+    course = COURSES[course_type]
+    module_ids = [q.get("module_id") for q in QUESTIONS if q["course_id"] == course["id"]]
+    lesson = lesson_for_module(course["lessons"], module_ids, module_id)
+    return lesson and lesson["title"]
+
+
+@pytest.mark.parametrize("module_id, title", [
+    (1, "Why You're Overpaying the IRS (and What to Do About It)"),
+    (2, "The 6 Levers That Actually Shift Your Tax Outcome"),
+    (3, "Real Tax Case Studies That Shift Everything"),
+])
+def test_blueprint_modules_start_one_before_lessons(module_id, title):
+    assert module_lesson_title("primer", module_id) == title
+
+
+@pytest.mark.parametrize("module_id, title", [
+    (1, "The Real Problem with W-2 Income"),
+    (7, "Oil & Gas Deductions"),
+    (8, "The Wealth Multiplier Loop"),
+    (9, "The IRS Escape Plan"),
+])
+def test_w2_modules_match_order_index(module_id, title):
+    assert module_lesson_title("w2", module_id) == title
+
+
+@pytest.mark.parametrize("module_id, title", [
+    (0, "Who This Is For & What You're About to Learn"),
+    (3, "Long-Term Wealth Creation & Legacy Structuring"),
+])
+def test_business_module_zero_is_gradable(module_id, title):
+    assert module_lesson_title("business", module_id) == title
+
+
+def test_unknown_module_has_no_lesson():
+    assert module_lesson_title("w2", 42) is None
+    assert lesson_for_module([], [1], 1) is None
+
+
+class FakeCourses:
+    async def find_one(self, query, projection=None):
+        return {"lessons": COURSES["business"]["lessons"]}
+
+
+class FakeDB:
+    courses = FakeCourses()
+
+
+class FakeXPBuffer:
+    def __init__(self):
+        self.awarded = []
+
+    async def award_quiz(self, user_id, points):
+        self.awarded.append(points)
+        return sum(self.awarded)
+
+    async def current_total(self, user_id):
+        return sum(self.awarded)
+
+
+@pytest.fixture
+def grading(monkeypatch, quiz_session_uses):
+    import server
+
+    course = COURSES["business"]
+    questions = [server.QuizQuestion(**q).dict() for q in QUESTIONS if q["course_id"] == course["id"]]
+    completed = []
+
+    async def get_quiz_bank(course_id, module_id):
+        return QuizBank([q for q in questions if module_id is None or q["module_id"] == module_id])
+
+    async def complete_lesson(db, user_id, course_id, lesson_id, score):
+        completed.append((lesson_id, score))
+        return None
+
+    xp = FakeXPBuffer()
+    monkeypatch.setattr(server, "db", FakeDB())
+    monkeypatch.setattr(server, "get_quiz_bank", get_quiz_bank)
+    monkeypatch.setattr(server, "complete_lesson", complete_lesson)
+    monkeypatch.setattr(server, "xp_buffer", xp)
+
+    def grade(module_id, answer_all):
+        bank = QuizBank([q for q in questions if q["module_id"] == module_id])
+        shuffled = bank.shuffled(11)
+        session = server.quiz_sessions.issue(course["id"], module_id, shuffled)
+        answers = {q["id"]: q["correct_answer_index"] if answer_all else None for q in shuffled}
+        request = server.QuizGradeRequest(session=session, answers=answers)
+        return asyncio.run(server.grade_module_quiz(course["id"], module_id, request))
+
+    return grade, completed, xp
+
+
+def test_module_zero_quiz_completes_its_lesson(grading):
+    grade, completed, xp = grading
+    result = grade(0, answer_all=True)
+    assert result["completed"]
+    assert result["lesson_id"] == COURSES["business"]["lessons"][0]["id"]
+    assert completed == [(result["lesson_id"], result["max_points"])]
+    assert xp.awarded == [result["max_points"]]
+
+
+def test_zero_score_does_not_complete_the_lesson(grading):
+    grade, completed, xp = grading
+    result = grade(1, answer_all=False)
+    assert result["points"] == 0
+    assert not result["completed"]
+    assert completed == [] and xp.awarded == []
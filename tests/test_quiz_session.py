@@ -0,0 +1,87 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+from quiz_bank import QuizBank, without_answers
+from quiz_session import QuizSessionCipher, QuizSessionError
+
+QUESTIONS = [
+    {"id": "q1", "question": "Pick B", "options": ["A", "B", "C"], "correct_answer": "B",
+     "explanation": "B is right", "points": 10},
+    {"id": "q2", "question": "Pick Z", "options": ["X", "Y", "Z", "W"], "correct_answer": "Z",
+     "explanation": "Z is right", "points": 20},
+]
+
+
+def issue(cipher, seed=7):
+    questions = QuizBank(QUESTIONS).shuffled(seed)
+    return questions, cipher.issue("course-1", 2, questions)
+
+
+def test_round_trip_grades_against_the_shuffled_key():
+    cipher = QuizSessionCipher("secret")
+    questions, token = issue(cipher)
+    session = cipher.verify(token)
+
+    assert session.course_id == "course-1"
+    assert session.module_id == 2
+    assert session.question_ids == ("q1", "q2")
+    first = questions[0]
+    assert first["options"][session.answer_key[0]] == "B"
+    assert session.grade("q1", first["correct_answer_index"]) == (True, 10, first["correct_answer_index"])
+    assert session.grade("q2", None)[:2] == (False, 0)
+    with pytest.raises(QuizSessionError):
+        session.grade("unknown", 0)
+
+
+def test_token_does_not_expose_the_answer_key():
+    _, token = issue(QuizSessionCipher("secret"))
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    assert b'"a"' not in raw and b"q1" not in raw
+
+
+def test_tampered_or_foreign_tokens_are_rejected():
+    cipher = QuizSessionCipher("secret")
+    _, token = issue(cipher)
+    tampered = token[:-6] + ("A" if token[-6] != "A" else "B") + token[-5:]
+    for bad in (tampered, token[:20], "", "not.a.token", issue(QuizSessionCipher("other"))[1]):
+        with pytest.raises(QuizSessionError):
+            cipher.verify(bad)
+
+
+def test_expired_tokens_are_rejected():
+    cipher = QuizSessionCipher("secret", ttl_seconds=-1)
+    _, token = issue(cipher)
+    with pytest.raises(QuizSessionError, match="expired"):
+        cipher.verify(token)
+
+
+def test_a_secret_is_required():
+    with pytest.raises(ValueError):
+        QuizSessionCipher("")
+
+
+def test_client_questions_carry_no_answers():
+    questions = QuizBank(QUESTIONS).shuffled(3)
+    public = without_answers(questions)
+    assert [q["options"] for q in public] == [q["options"] for q in questions]
+    assert not any({"correct_answer", "correct_answer_index", "explanation"} & set(q) for q in public)
+    json.dumps(public)
+
+
+def test_ledger_grades_once_and_never_after_a_reveal(quiz_session_uses):
+    from quiz_session import QuizSessionLedger
+
+    cipher = QuizSessionCipher("secret")
+    ledger = QuizSessionLedger(quiz_session_uses)
+    graded = cipher.verify(issue(cipher)[1])
+    revealed = cipher.verify(issue(cipher)[1])
+    assert graded.session_id != revealed.session_id
+
+    async def scenario():
+        await ledger.reveal(revealed)
+        return [await ledger.consume(graded), await ledger.consume(graded), await ledger.consume(revealed)]
+
+    assert asyncio.run(scenario()) == [True, False, False]
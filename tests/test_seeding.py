@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime
+
+from pymongo import DeleteMany, ReplaceOne
+
+from seeding import sync_collection
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return [dict(doc) for doc in self.docs]
+
+
+class FakeCollection:
+    """Stores documents by id and applies the ReplaceOne / DeleteMany operations sync_collection issues"""
+
+    def __init__(self, docs):
+        self.docs = {doc["id"]: dict(doc) for doc in docs}
+        self.writes = []
+
+    def find(self, query, projection=None):
+        return FakeCursor(list(self.docs.values()))
+
+    async def bulk_write(self, operations, ordered=True):
+        self.writes.append(operations)
+        for operation in operations:
+            if isinstance(operation, ReplaceOne):
+                self.docs[operation._filter["id"]] = dict(operation._doc)
+            elif isinstance(operation, DeleteMany):
+                keep = set(operation._filter["id"]["$nin"])
+                self.docs = {id_: doc for id_, doc in self.docs.items() if id_ in keep}
+
+
+def sync(stored, seed):
+    collection = FakeCollection(stored)
+    result = asyncio.run(sync_collection({"courses": collection}, "courses", seed))
+    return result, collection
+
+
+def test_unchanged_documents_are_not_written():
+    docs = [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]
+    result, collection = sync(docs, [dict(doc, created_at=datetime(2030, 1, 1)) for doc in docs])
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (0, 0, 0, 2)
+    assert result.changed_ids == []
+    assert collection.writes == []
+
+
+def test_inserts_updates_and_deletes_in_one_bulk_write():
+    created = datetime(2024, 5, 1)
+    stored = [
+        {"id": "a", "title": "A", "created_at": created},
+        {"id": "b", "title": "B"},
+        {"id": "gone", "title": "Old"},
+    ]
+    seed = [
+        {"id": "a", "title": "A revised", "created_at": datetime(2030, 1, 1)},
+        {"id": "b", "title": "B"},
+        {"id": "new", "title": "New"},
+    ]
+    result, collection = sync(stored, seed)
+
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (1, 1, 1, 1)
+    assert result.changed_ids == ["a", "new", "gone"]
+    assert len(collection.writes) == 1
+    assert set(collection.docs) == {"a", "b", "new"}
+    assert collection.docs["a"] == {"id": "a", "title": "A revised", "created_at": created}
+
+
+def test_empty_seed_deletes_everything():
+    result, collection = sync([{"id": "a"}, {"id": "b"}], [])
+    assert result.deleted == 2
+    assert result.changed_ids == ["a", "b"]
+    assert collection.docs == {}
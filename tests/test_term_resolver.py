@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from term_resolver import TermResolver
+
+GLOSSARY = json.loads((Path(__file__).resolve().parent.parent / "backend" / "content_pack" / "glossary.json").read_text())
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    return TermResolver(GLOSSARY)
+
+
+@pytest.mark.parametrize("query, term", [
+    ("1031", "Capital Gain Deferral"),  # Only mentioned in definitions
+    ("1099", "Income Type Stack"),
+    ("1040", "1040"),
+    ("real estate professional status", "Real Estate Professional Status (REPS)"),
+    ("bonus depreciaton", "Bonus Depreciation"),
+])
+def test_resolves_queries_to_the_right_term(resolver, query, term):
+    assert resolver.resolve(query)["term"] == term
+
+
+def test_definition_matches_rank_below_name_matches():
+    resolver = TermResolver([
+        {"id": "a", "term": "Depreciation", "definition": "Deducting an asset's cost over time."},
+        {"id": "b", "term": "Cost Segregation", "definition": "Accelerates depreciation on a building."},
+    ])
+    assert [t["id"] for t in resolver.rank("depreciation")] == ["a", "b"]
+
+
+def test_unknown_numbers_resolve_to_nothing(resolver):
+    assert resolver.resolve("4797") is None
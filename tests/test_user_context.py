@@ -0,0 +1,53 @@
+import asyncio
+
+from entitlements import Entitlement
+from user_context import load_chat_turn_context
+
+ALL_ACCESS = Entitlement(plan_type="all_access", has_active_subscription=True)
+
+
+class FakeEntitlements:
+    """Entitlement reads that only finish once the thread lookup has started"""
+
+    def __init__(self, thread_started):
+        self.thread_started = thread_started
+
+    async def get(self, user_id):
+        await self.thread_started.wait()
+        return ALL_ACCESS
+
+
+class FakeChatThreads:
+    def __init__(self, thread_started, threads):
+        self.thread_started = thread_started
+        self.threads = threads
+
+    async def find_one(self, query, projection):
+        self.thread_started.set()
+        owned = (query["id"], query["user_id"]) in self.threads
+        return {"_id": query["id"]} if owned else None
+
+
+class FakeDB:
+    def __init__(self, chat_threads):
+        self.chat_threads = chat_threads
+
+
+def load(thread_id):
+    async def scenario():
+        thread_started = asyncio.Event()
+        db = FakeDB(FakeChatThreads(thread_started, {("t1", "u1")}))
+        context = load_chat_turn_context(db, FakeEntitlements(thread_started), "u1", thread_id)
+        return await asyncio.wait_for(context, timeout=1)  # A serial load would never finish
+
+    return asyncio.run(scenario())
+
+
+def test_entitlement_and_thread_are_read_concurrently():
+    context = load("t1")
+    assert context.entitlement == ALL_ACCESS
+    assert context.owns_thread
+
+
+def test_threads_of_other_users_are_not_owned():
+    assert not load("t2").owns_thread
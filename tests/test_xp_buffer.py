@@ -0,0 +1,116 @@
+import asyncio
+
+from xp_buffer import XPEventBuffer
+
+
+class FakeUserXP:
+    """Applies quiz $inc updates; bulk_write can be held open to observe reads mid-flush"""
+
+    def __init__(self):
+        self.docs = {}
+        self.written = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def find_one(self, query, projection=None):
+        doc = self.docs.get(query["user_id"])
+        return dict(doc) if doc else None
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs.setdefault(query["user_id"], dict(update["$setOnInsert"]))
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            doc = self.docs.setdefault(operation._filter["user_id"], {"user_id": operation._filter["user_id"]})
+            for key, value in operation._doc["$inc"].items():
+                doc[key] = doc.get(key, 0) + value
+        self.written.set()
+        await self.release.wait()
+
+
+class FakeOrdinals:
+    """Term ordinals that go stale once renumbered, the way another process's reseed makes them"""
+
+    def __init__(self):
+        self.ordinals = {}
+        self.renumbered = False
+
+    async def refresh(self):
+        renumbered, self.renumbered = self.renumbered, False
+        return renumbered
+
+    async def ordinal(self, term_id):
+        return self.ordinals.setdefault(term_id, len(self.ordinals))
+
+
+def default_xp(user_id):
+    return {"user_id": user_id, "total_xp": 0, "quiz_xp": 0, "glossary_xp": 0}
+
+
+def test_read_during_flush_counts_quiz_xp_once():
+    async def scenario():
+        collection = FakeUserXP()
+        buffer = XPEventBuffer(collection, ordinals=FakeOrdinals())
+        await buffer.award_quiz("u1", 25)
+        collection.release.clear()
+        flush = asyncio.create_task(buffer.flush())
+        await collection.written.wait()
+
+        read = asyncio.create_task(buffer.read("u1", default_xp("u1")))
+        await asyncio.sleep(0)
+        collection.release.set()
+        await flush
+        return await read, buffer.total_xp("u1")
+
+    user_xp, total = asyncio.run(scenario())
+    assert user_xp["quiz_xp"] == 25
+    assert user_xp["total_xp"] == 25
+    assert total == 25
+
+
+def test_read_merges_pending_awards_into_default():
+    async def scenario():
+        buffer = XPEventBuffer(FakeUserXP(), ordinals=FakeOrdinals())
+        await buffer.award_quiz("u1", 10)
+        return await buffer.read("u1", default_xp("u1"))
+
+    user_xp = asyncio.run(scenario())
+    assert user_xp["total_xp"] == 10
+    assert user_xp["quiz_xp"] == 10
+
+
+def test_reset_forgets_in_flight_awards():
+    async def scenario():
+        collection = FakeUserXP()
+        buffer = XPEventBuffer(collection, ordinals=FakeOrdinals())
+        await buffer.award_quiz("u1", 10)
+        collection.release.clear()
+        flush = asyncio.create_task(buffer.flush())
+        await collection.written.wait()
+        reset = asyncio.create_task(buffer.reset())
+        await asyncio.sleep(0)
+        collection.release.set()
+        await asyncio.gather(flush, reset)
+        return buffer
+
+    buffer = asyncio.run(scenario())
+    assert buffer.total_xp("u1") == 0
+    assert not buffer._inflight and not buffer._pending
+
+
+def test_renumbered_ordinals_drop_queued_views_and_cached_bits():
+    async def scenario():
+        ordinals = FakeOrdinals()
+        buffer = XPEventBuffer(FakeUserXP(), ordinals)
+        await buffer.award_glossary("u1", "t1")
+        await buffer.award_quiz("u1", 5)
+        ordinals.renumbered = True
+        ordinals.ordinals = {}
+        awarded, total = await buffer.award_glossary("u2", "t9")
+        return buffer, awarded, total
+
+    buffer, awarded, total = asyncio.run(scenario())
+    assert awarded and total == 10
+    assert buffer._pending["u1"].glossary_ordinals == [] and buffer._pending["u1"].quiz_xp == 5
+    assert "u1" not in buffer._snapshots
+    assert buffer._pending_events == 2
@@ -22,6 +22,8 @@ print(f"Using backend URL: {BACKEND_URL}")
 # Load environment variables for MongoDB connection
 ROOT_DIR = Path(__file__).parent / 'backend'
 load_dotenv(ROOT_DIR / '.env')
+sys.path.insert(0, str(ROOT_DIR))
+from catalog_cache import bump_catalog_version  # noqa: E402
 
 # MongoDB connection
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/')
@@ -238,6 +240,7 @@ async def main():
         
         # Then, ensure all terms have enhanced formatting
         await ensure_enhanced_formatting()
+        await bump_catalog_version(db, "glossary")
         
         # Finally, test the glossary API
         success = test_glossary_endpoint()